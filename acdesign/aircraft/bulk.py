@@ -0,0 +1,89 @@
+import pandas as pd
+from json import load
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Dict, Tuple, Union
+from .plane import ConventionalPlane
+
+
+def _nested(data) -> bool:
+    return isinstance(data, dict) or \
+        (isinstance(data, list) and len(data) > 0 and all(isinstance(v, dict) for v in data))
+
+
+def flatten(data: dict, prefix: str="") -> dict:
+    """A dumpd structure as a single level dict with keys joined by ".". Items of lists
+    of dicts are keyed on their name, where they have one, otherwise their index.
+    Other lists are left as values."""
+    items = data.items() if isinstance(data, dict) else \
+        [(v.get("name", i), v) for i, v in enumerate(data)]
+    flat = {}
+    for k, v in items:
+        key = f"{prefix}.{k}" if prefix else str(k)
+        if _nested(v):
+            flat.update(flatten(v, key))
+        else:
+            flat[key] = v
+    return flat
+
+
+def _read(file: Path):
+    try:
+        with open(file, "r") as f:
+            return file.stem, load(f), None
+    except Exception as ex:
+        return file.stem, None, f"{type(ex).__name__}: {ex}"
+
+
+def _plane(file: Path):
+    key, data, error = _read(file)
+    if error is None:
+        try:
+            return key, ConventionalPlane.from_dict(data), None
+        except Exception as ex:
+            return key, None, f"{type(ex).__name__}: {ex}"
+    return key, None, error
+
+
+def _row(file: Path):
+    key, data, error = _read(file)
+    return key, None if error else flatten(data), error
+
+
+def _map(func, directory: Union[str, Path], pattern: str, processes: bool, max_workers: int, chunksize: int):
+    pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    results, errors = {}, {}
+    with pool(max_workers) as executor:
+        for key, res, error in executor.map(func, sorted(Path(directory).glob(pattern)), chunksize=chunksize):
+            if error is None:
+                results[key] = res
+            else:
+                errors[key] = error
+    return results, errors
+
+
+def load_planes(directory: Union[str, Path], pattern: str="*.json", processes: bool=True, max_workers: int=None, chunksize: int=8) -> Tuple[Dict[str, ConventionalPlane], Dict[str, str]]:
+    """Parse every design file in a directory in a process (or thread) pool.
+    Files that cannot be read are reported rather than raised.
+
+    Args:
+        directory (Union[str, Path]): folder of files written by Plane.dump_json
+        pattern (str, optional): glob for the files to read. Defaults to "*.json".
+        processes (bool, optional): use a process pool. Defaults to True.
+        max_workers (int, optional): pool size. Defaults to the executor default.
+        chunksize (int, optional): files per task when using processes. Defaults to 8.
+
+    Returns:
+        Tuple[Dict[str, ConventionalPlane], Dict[str, str]]: file stem: plane, file stem: error
+    """
+    return _map(_plane, directory, pattern, processes, max_workers, chunksize)
+
+
+def load_table(directory: Union[str, Path], pattern: str="*.json", processes: bool=True, max_workers: int=None, chunksize: int=64) -> Tuple[pd.DataFrame, Dict[str, str]]:
+    """The parameters of every design file in a directory as one table, a row per file
+    indexed on the file stem and a column per flattened key. No aircraft objects are built,
+    so this is much cheaper than load_planes when only the parameters are needed.
+    Arguments as for load_planes.
+    """
+    rows, errors = _map(_row, directory, pattern, processes, max_workers, chunksize)
+    return pd.DataFrame.from_dict(rows, orient="index").rename_axis("design"), errors
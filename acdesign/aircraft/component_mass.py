@@ -2,9 +2,10 @@ from os import name
 from geometry import Point, Transformation, Mass, P0
 import numpy as np
 from typing import List, Dict
+from .fingerprint import Fingerprinted
 
 
-class ComponentMass:
+class ComponentMass(Fingerprinted):
     def __init__(self, name: str, cg : Point, mass: Mass):
         self.name = name
         self.cg = cg
@@ -50,4 +51,4 @@ class ComponentMass:
             cg=self.cg.to_dict(),
             m=self.mass.m[0],
             geom={"shape": "point"}
-        )
\ No newline at end of file
+        )
@@ -0,0 +1,45 @@
+import json
+import hashlib
+import numpy as np
+
+
+# decimal places of the numbers in saved designs, and so the tolerance of fingerprints
+precision = 3
+
+
+def canonical(obj, ndigits: int=precision):
+    """A copy of a dumpd structure in which equivalent designs compare equal. Numbers
+    become floats rounded to ndigits, so 400, 400.0 and 399.9999 are the same,
+    and -0.0 becomes 0.0. Tuples become lists."""
+    if isinstance(obj, dict):
+        return {str(k): canonical(v, ndigits) for k, v in obj.items()}
+    elif isinstance(obj, (list, tuple, np.ndarray)):
+        return [canonical(v, ndigits) for v in obj]
+    elif isinstance(obj, np.generic):
+        obj = obj.item()
+    if isinstance(obj, (int, float)) and not isinstance(obj, bool):
+        return round(float(obj), ndigits) + 0.0
+    return obj
+
+
+def fingerprint(data: dict, ndigits: int=precision) -> str:
+    """A stable hex digest of a dumpd structure, to use as a cache key. Numbers are
+    compared to ndigits decimal places in the model units (mm, degrees, kg), the same
+    rounding as Plane.dump_json, so a design keeps its key when saved and reloaded.
+    Values that fall either side of a rounding boundary can still differ.
+
+    Args:
+        data (dict): the output of dumpd
+        ndigits (int, optional): decimal places to compare. Defaults to precision.
+    """
+    text = json.dumps(canonical(data, ndigits), sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+class Fingerprinted:
+    """Adds a fingerprint property to a class with a dumpd method"""
+
+    @property
+    def fingerprint(self) -> str:
+        """hash of dumpd that is equal for equivalent objects, see fingerprint"""
+        return fingerprint(self.dumpd())
@@ -0,0 +1,86 @@
+from geometry import Point, Quaternion, Transformation, PX
+from typing import List
+import numpy as np
+
+
+def compose(outer: Transformation, inner: Transformation) -> Transformation:
+    """outer.apply(inner) for equal length (or length 1 outer) stacks of transformations"""
+    return Transformation.build(
+        outer.translation + outer.rotation.transform_point(inner.translation),
+        outer.rotation * inner.rotation
+    )
+
+
+class RibFrames:
+    def __init__(self, panel: np.ndarray, names: List[str], transform: Transformation, chord: np.ndarray):
+        """The global frame of every rib in a set of panels, one row per rib, in panel order
+        with the inboard rib first.
+
+        Args:
+            panel (np.ndarray): (n,) index of the panel each rib belongs to
+            names (List[str]): the panel names
+            transform (Transformation): (n,) rib frames in the body frame
+            chord (np.ndarray): (n,) rib chords
+        """
+        self.panel = panel
+        self.names = names
+        self.transform = transform
+        self.chord = chord
+
+    def __len__(self) -> int:
+        return len(self.chord)
+
+    @staticmethod
+    def build(panels: list):
+        """Stack every panel and rib transform and compose them in one step"""
+        ribs = [(i, p.transform.data, r.transform.data, r.chord) for i, p in enumerate(panels) for r in p.ribs]
+        return RibFrames(
+            np.array([r[0] for r in ribs]),
+            [p.name for p in panels],
+            compose(
+                Transformation(np.concatenate([r[1] for r in ribs])),
+                Transformation(np.concatenate([r[2] for r in ribs]))
+            ),
+            np.array([r[3] for r in ribs], dtype=float)
+        )
+
+    def apply_transformation(self, trans: Transformation):
+        """The frames in another axis system, trans from body to that system"""
+        return RibFrames(self.panel, self.names, compose(trans, self.transform), self.chord)
+
+    def select(self, panel: int):
+        """rows for one panel"""
+        return np.flatnonzero(self.panel == panel)
+
+    @property
+    def le(self) -> Point:
+        """leading edge positions"""
+        return self.transform.translation
+
+    @property
+    def rotation(self) -> Quaternion:
+        return self.transform.rotation
+
+    @property
+    def rotation_matrix(self) -> np.ndarray:
+        """(n, 3, 3) section axes"""
+        return self.rotation.to_rotation_matrix()
+
+    @property
+    def chord_direction(self) -> Point:
+        return self.rotation.transform_point(PX())
+
+    @property
+    def chord_vector(self) -> Point:
+        """leading edge to trailing edge"""
+        return self.chord_direction * self.chord
+
+    @property
+    def te(self) -> Point:
+        return self.le + self.chord_vector
+
+    @property
+    def incidence(self) -> np.ndarray:
+        """as Rib.incidence, for each rib in this axis system"""
+        cline = self.chord_direction
+        return np.arctan2(cline.y, cline.x)
@@ -0,0 +1,34 @@
+from threading import Lock
+
+
+class Lazy:
+    def __init__(self, func, *args):
+        """A value calculated from func(*args) the first time it is needed. One instance 
+        can be shared by immutable copies of an object whose inputs to func are unchanged,
+        so the value is only calculated once for all of them.
+        """
+        self.func = func
+        self.args = args
+        self._value = None
+        self._done = False
+        self._lock = Lock()
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    def __call__(self):
+        if not self._done:
+            with self._lock:
+                if not self._done:
+                    self._value = self.func(*self.args)
+                    self._done = True
+                    self.args = ()
+        return self._value
+
+    def __getstate__(self):
+        return dict(func=self.func, args=self.args, _value=self._value, _done=self._done)
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = Lock()
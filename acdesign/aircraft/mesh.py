@@ -0,0 +1,163 @@
+import numpy as np
+from pathlib import Path
+from typing import Iterator, List, Union
+from acdesign.airfoils.airfoil_set import AirfoilSet, cosine_spacing
+from .frames import RibFrames
+
+
+stl_dtype = np.dtype([
+    ("normal", "<f4", (3,)),
+    ("vertices", "<f4", (3, 3)),
+    ("attr", "<u2"),
+])
+
+
+def section_coords(ribs: list, m: int=41) -> np.ndarray:
+    """(n, 2m-1, 2) rib coordinates in the rib frames, resampled to m cosine spaced
+    chordwise stations per surface. Ribs that share a shape, chord and trailing edge
+    thickness are only resampled once."""
+    x = cosine_spacing(m)
+    done = {}
+    coords = []
+    for rib in ribs:
+        key = (id(rib.section.shape), rib.chord, rib.te_thickness) if rib.section is not None else id(rib)
+        if key not in done:
+            pts = rib.points
+            upper, lower = AirfoilSet.resample_coords(np.column_stack([pts.x, pts.y]), x)
+            done[key] = rib.chord * np.column_stack([
+                np.concatenate([x[::-1], x[1:]]),
+                np.concatenate([upper[::-1], lower[1:]]),
+            ])
+        coords.append(done[key])
+    return np.array(coords)
+
+
+class LoftedMesh:
+    def __init__(self, names: List[str], inbd: np.ndarray, otbd: np.ndarray, spanwise: int=8, caps: bool=True):
+        """Triangulated surfaces lofted linearly between the inboard and outboard ribs of
+        each panel. Triangles are generated in blocks of spanwise rows across all the
+        panels at once, so a mesh never needs to be held in memory to be written.
+
+        Args:
+            names (List[str]): panel names
+            inbd (np.ndarray): (n, k, 3) global inboard section points, in Selig order
+            otbd (np.ndarray): (n, k, 3) global outboard section points
+            spanwise (int, optional): rows of quads between the ribs. Defaults to 8.
+            caps (bool, optional): close the ends of each panel. Defaults to True.
+        """
+        self.names = names
+        self.inbd = inbd
+        self.otbd = otbd
+        self.spanwise = spanwise
+        self.caps = caps
+        self.open_te = np.any(np.abs(inbd[:, 0] - inbd[:, -1]) > 1e-9, axis=1) | \
+            np.any(np.abs(otbd[:, 0] - otbd[:, -1]) > 1e-9, axis=1)
+
+    @staticmethod
+    def from_panels(panels: list, frames: RibFrames=None, chordwise: int=41, spanwise: int=8, caps: bool=True):
+        """Mesh a list of two rib panels, for example Plane.panels or Wing.panels.
+
+        Args:
+            panels (list): the panels
+            frames (RibFrames, optional): global rib frames of the panels, if already known.
+                Defaults to None, built from the panels.
+            chordwise (int, optional): stations per surface. Defaults to 41.
+            spanwise (int, optional): rows of quads between the ribs. Defaults to 8.
+            caps (bool, optional): close the ends of each panel. Defaults to True.
+        """
+        frames = RibFrames.build(panels) if frames is None else frames
+        local = section_coords([r for p in panels for r in p.ribs], chordwise)
+        local = np.concatenate([local, np.zeros(local.shape[:2] + (1,))], axis=2)
+        glob = frames.le.data[:, None, :] + np.einsum("nji,nkj->nki", frames.rotation_matrix, local)
+        ends = np.array([[frames.select(i)[0], frames.select(i)[-1]] for i in range(len(panels))])
+        return LoftedMesh(frames.names, glob[ends[:, 0]], glob[ends[:, 1]], spanwise, caps)
+
+    @staticmethod
+    def from_plane(plane, chordwise: int=41, spanwise: int=8, caps: bool=True):
+        """Mesh a Plane or Wing using its cached rib frames"""
+        return LoftedMesh.from_panels(plane.panels, plane.rib_frames, chordwise, spanwise, caps)
+
+    @property
+    def m(self) -> int:
+        return (self.inbd.shape[1] + 1) // 2
+
+    def __len__(self) -> int:
+        """number of triangles"""
+        k = self.inbd.shape[1]
+        n = len(self.names)
+        return self.spanwise * (2 * n * (k - 1) + 2 * int(np.sum(self.open_te))) + \
+            (2 * n * (2 * self.m - 3) if self.caps else 0)
+
+    def rows(self, start: int, stop: int) -> np.ndarray:
+        """(n, stop-start, k, 3) vertices of spanwise rows start to stop - 1 of every panel"""
+        t = (np.arange(start, stop) / self.spanwise)[None, :, None, None]
+        return (1 - t) * self.inbd[:, None] + t * self.otbd[:, None]
+
+    @staticmethod
+    def _quads(a, b, c, d) -> np.ndarray:
+        """two triangles per quad a, b, c, d, each (..., 3)"""
+        return np.stack([np.stack([a, b, c], axis=-2), np.stack([a, c, d], axis=-2)], axis=-3).reshape(-1, 3, 3)
+
+    def _cap(self, sec: np.ndarray, flip: bool) -> np.ndarray:
+        """triangles closing (n, k, 3) sections, pairing upper and lower points at each station"""
+        m = self.m
+        upper = sec[:, m - 1::-1]
+        lower = sec[:, m - 1:]
+        le = np.stack([upper[:, 0], lower[:, 1], upper[:, 1]], axis=-2)
+        quads = LoftedMesh._quads(upper[:, 1:-1], lower[:, 1:-1], lower[:, 2:], upper[:, 2:])
+        tris = np.concatenate([le, quads])
+        return tris[:, ::-1] if flip else tris
+
+    def triangles(self, max_triangles: int=200000) -> Iterator[np.ndarray]:
+        """(t, 3, 3) blocks of triangles, each of at most about max_triangles"""
+        k = self.inbd.shape[1]
+        per_row = 2 * len(self.names) * k
+        step = max(1, max_triangles // per_row)
+        if self.caps:
+            yield self._cap(self.inbd, False)
+        for start in range(0, self.spanwise, step):
+            stop = min(start + step, self.spanwise)
+            v = self.rows(start, stop + 1)
+            skin = LoftedMesh._quads(v[:, :-1, :-1], v[:, 1:, :-1], v[:, 1:, 1:], v[:, :-1, 1:])
+            te = v[self.open_te]
+            yield np.concatenate([
+                skin,
+                LoftedMesh._quads(te[:, :-1, -1], te[:, 1:, -1], te[:, 1:, 0], te[:, :-1, 0])
+            ])
+        if self.caps:
+            yield self._cap(self.otbd, True)
+
+    @staticmethod
+    def normals(tris: np.ndarray) -> np.ndarray:
+        n = np.cross(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0])
+        length = np.linalg.norm(n, axis=1, keepdims=True)
+        return np.divide(n, length, out=np.zeros_like(n), where=length > 0)
+
+    def write_stl(self, file: Union[str, Path], max_triangles: int=200000):
+        """Stream the mesh to a binary STL file"""
+        with open(file, "wb") as f:
+            f.write(b"acdesign lofted mesh".ljust(80, b" "))
+            f.write(np.uint32(len(self)).tobytes())
+            for tris in self.triangles(max_triangles):
+                block = np.zeros(len(tris), dtype=stl_dtype)
+                block["normal"] = LoftedMesh.normals(tris)
+                block["vertices"] = tris
+                f.write(block.tobytes())
+
+    def write_obj(self, file: Union[str, Path], max_triangles: int=200000):
+        """Stream the mesh to an OBJ file, three vertices per triangle"""
+        n = 0
+        with open(file, "w") as f:
+            for tris in self.triangles(max_triangles):
+                np.savetxt(f, tris.reshape(-1, 3), fmt="v %.6f %.6f %.6f")
+                faces = n + 1 + np.arange(len(tris) * 3).reshape(-1, 3)
+                np.savetxt(f, faces, fmt="f %d %d %d")
+                n += len(tris) * 3
+
+    @staticmethod
+    def read_stl(file: Union[str, Path]) -> np.ndarray:
+        """(t, 3, 3) triangles from a binary STL file"""
+        with open(file, "rb") as f:
+            f.seek(80)
+            n = int(np.frombuffer(f.read(4), dtype="<u4")[0])
+            return np.frombuffer(f.read(n * stl_dtype.itemsize), dtype=stl_dtype)["vertices"].astype(float)
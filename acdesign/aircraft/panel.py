@@ -1,13 +1,18 @@
-from geometry import Point, Transformation, Euler, PX, PY, P0, Q0
+from geometry import Point, Transformation, Euler, PX, PY, P0
 from typing import List
 from .rib import Rib
+from .lazy import Lazy
+from .fingerprint import Fingerprinted
 from typing import Dict, List
 import numpy as np
+import copy
 
 
 
 class PanelProps:
     def __init__(self, p):
+        """Derived geometry of a panel. Only ymax depends on the panel position, so 
+        offset copies of the panel take the rest from the original, see offset."""
         self.ymax = p.otbd.y[0] + p.y[0]
         self.semispan = p.otbd.y[0] - p.inbd.y[0]
         self.SMC = (p.inbd.chord + p.otbd.chord) / 2
@@ -34,6 +39,13 @@ class PanelProps:
     
         self.pMAC = Point(yMAC * self.le_sweep_distance / self.semispan , yMAC, 0) 
 
+    @staticmethod
+    def offset(props: Lazy, trans: Point):
+        """The props of a panel moved by trans, from the Lazy props of the original"""
+        res = copy.copy(props())
+        res.ymax = res.ymax + trans.y[0]
+        return res
+
 
 
 class LECurve:
@@ -48,25 +60,34 @@ class LECurve:
 linear = LECurve("line", lambda y_over_b, sweep: sweep * y_over_b)
 
 
-class Panel:
+class Panel(Fingerprinted):
     def __init__(
         self, 
         name: str,
         transform: Transformation, 
         ribs: List[Rib],
+        props: Lazy=None
     ):
         """A panel represents a constant taper section of wing, tail, fin etc.  
 
         Args:
             transform (Transformation): from body frame to y axis along length of panel, x axis aft, z up)
             ribs List[Rib]: currently just supports two ribs, inbd and otbd. 
+            props (Lazy, optional): PanelProps derived from another panel with the same 
+                ribs and rotation. Defaults to None, calculated on first access.
         """
         self.name= name
         self.transform = transform
         self.ribs = ribs
-        self.props = PanelProps(self)
+        self._props = Lazy(PanelProps, self) if props is None else props
+
+    @property
+    def props(self) -> PanelProps:
+        return self._props()
 
     def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(f"Attribute {name} not found")
         if name in ["inbd", "root"]:
             return self.ribs[0]
         elif name in ["otbd", "tip"]:
@@ -140,4 +161,9 @@ class Panel:
         )
 
     def offset(self, trans: Point):
-        return self.apply_transformation(Transformation(trans, Q0()))
\ No newline at end of file
+        return Panel(
+            self.name,
+            Transformation(self.transform.translation + trans, self.transform.rotation),
+            self.ribs,
+            Lazy(PanelProps.offset, self._props, trans)
+        )
\ No newline at end of file
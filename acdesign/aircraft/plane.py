@@ -4,12 +4,28 @@ from .panel import Panel
 from .body import Body
 from .component_mass import ComponentMass
 from .wing import Wing
+from .frames import RibFrames
+from .lazy import Lazy
+from .fingerprint import Fingerprinted, precision
 import numpy as np
-from json import load, dump, loads, dumps
+from json import load, dump
 
 
 
-class Plane:
+def rounded(obj, ndigits: int=precision):
+    """Copy of a dumpd structure ready for json, with numpy scalars converted and floats rounded"""
+    if isinstance(obj, dict):
+        return {k: rounded(v, ndigits) for k, v in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return [rounded(v, ndigits) for v in obj]
+    elif isinstance(obj, np.generic):
+        obj = obj.item()
+    if isinstance(obj, float):
+        return round(obj, ndigits)
+    return obj
+
+
+class Plane(Fingerprinted):
     """An aircraft. Origin on nose, x axis forward, y axis to right, z axis down.
     """
     def __init__(self, name: str, panels: List[Panel], bodies:List[Body], masses: List[ComponentMass]):
@@ -18,6 +34,12 @@ class Plane:
         self.bodies = bodies
         self.masses = masses
         self.mass = None#ComponentMass.combine(masses)
+        self._rib_frames = Lazy(RibFrames.build, panels)
+
+    @property
+    def rib_frames(self) -> RibFrames:
+        """global frames of every rib, calculated together on first access"""
+        return self._rib_frames()
 
     @staticmethod
     def create(name, panels, bodies=[], masses=[], version=0.01):
@@ -38,20 +60,13 @@ class Plane:
             masses=[m.dumpd() for m in self.masses],
         )
 
-    def dump_json(self, file):
-        def np_encoder(object):
-            if isinstance(object, np.generic):
-                return object.item()
-        with open(file, 'w') as f:
-            #this is a nice bodge from stack overflow to format floats in json dump
-            dump(
-                loads(
-                    dumps(self.dumpd(), default=np_encoder), 
-                    parse_float=lambda x: round(float(x), 3)
-                ),
-                f, indent=2
-            )
-
+    def dump_json(self, file, ndigits: int=precision):
+        """Write the design to a json file or file-like object, with floats rounded to ndigits"""
+        if hasattr(file, 'write'):
+            dump(rounded(self.dumpd(), ndigits), file, indent=2)
+        else:
+            with open(file, 'w') as f:
+                dump(rounded(self.dumpd(), ndigits), f, indent=2)
 
     @property
     def sref(self) -> float:
@@ -87,12 +102,8 @@ class ConventionalPlane(Plane):
     
     
     @staticmethod
-    def parse_json(file):
-        if hasattr(file, 'read'):
-            plane = Plane.create(**load(f))
-        else:
-            with open(file, "r") as f:
-                plane = Plane.create(**load(f))
+    def from_dict(data: dict):
+        plane = Plane.create(**data)
         return ConventionalPlane(
             plane.name,
             Wing([p for p in plane.panels if "wing" in p.name]),
@@ -101,6 +112,13 @@ class ConventionalPlane(Plane):
             plane.bodies, plane.masses
         )
 
+    @staticmethod
+    def parse_json(file):
+        if hasattr(file, 'read'):
+            return ConventionalPlane.from_dict(load(file))
+        with open(file, "r") as f:
+            return ConventionalPlane.from_dict(load(f))
+
     def scale(self, fac):
         return ConventionalPlane(
             self.name,
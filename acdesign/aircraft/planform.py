@@ -0,0 +1,176 @@
+from acdesign.aircraft import Panel, Rib
+from acdesign.aircraft.wing import Wing
+from geometry import Point, Transformation, Euler
+from typing import List
+import numpy as np
+import pandas as pd
+
+
+class Planform:
+    def __init__(
+        self, names: List[str], origin: np.ndarray, dihedral: np.ndarray, incidence: np.ndarray,
+        le: np.ndarray, chord: np.ndarray, twist: np.ndarray, te_thickness: np.ndarray,
+        airfoil: np.ndarray, airfoils: List[str], symm: bool=True
+    ):
+        """Array backed wing geometry. Each panel has an inboard and an outboard rib station,
+        so the station arrays are (n panels, 2). The arrays can be modified in place,
+        the properties are recalculated from them on every access.
+
+        Args:
+            names (List[str]): panel names
+            origin (np.ndarray): (n, 3) panel positions in the body frame
+            dihedral (np.ndarray): (n,) panel dihedral, radians
+            incidence (np.ndarray): (n,) panel incidence, radians
+            le (np.ndarray): (n, 2, 3) rib leading edge positions in the panel frame
+            chord (np.ndarray): (n, 2) rib chords
+            twist (np.ndarray): (n, 2) rib incidence relative to the panel, radians
+            te_thickness (np.ndarray): (n, 2) rib trailing edge thicknesses
+            airfoil (np.ndarray): (n, 2) index into airfoils for each rib
+            airfoils (List[str]): airfoil names
+            symm (bool, optional): wing is mirrored about the xz plane. Defaults to True.
+        """
+        self.names = list(names)
+        self.origin = np.asarray(origin, dtype=float)
+        self.dihedral = np.asarray(dihedral, dtype=float)
+        self.incidence = np.asarray(incidence, dtype=float)
+        self.le = np.asarray(le, dtype=float)
+        self.chord = np.asarray(chord, dtype=float)
+        self.twist = np.asarray(twist, dtype=float)
+        self.te_thickness = np.asarray(te_thickness, dtype=float)
+        self.airfoil = np.asarray(airfoil, dtype=int)
+        self.airfoils = list(airfoils)
+        self.symm = symm
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @staticmethod
+    def from_wing(wing: Wing):
+        airfoils = list(dict.fromkeys(r.name for p in wing.panels for r in p.ribs))
+        return Planform(
+            [p.name for p in wing.panels],
+            [p.transform.translation.data[0] for p in wing.panels],
+            [p.props.dihedral for p in wing.panels],
+            [p.props.incidence for p in wing.panels],
+            [[r.transform.translation.data[0] for r in p.ribs] for p in wing.panels],
+            [[r.chord for r in p.ribs] for p in wing.panels],
+            [[r.incidence for r in p.ribs] for p in wing.panels],
+            [[r.te_thickness for r in p.ribs] for p in wing.panels],
+            [[airfoils.index(r.name) for r in p.ribs] for p in wing.panels],
+            airfoils,
+            wing.symm
+        )
+
+    def to_wing(self) -> Wing:
+        """Wing objects for the planform, with the panel transforms built as in Panel.create"""
+        return Wing([
+            Panel(
+                name,
+                Transformation.build(Point(*origin), Euler(dihedral + np.pi, incidence, np.pi)),
+                [
+                    Rib.create(self.airfoils[af], c, Point(*le), te, np.degrees(tw))
+                    for le, c, tw, te, af in zip(self.le[i], self.chord[i], self.twist[i], self.te_thickness[i], self.airfoil[i])
+                ]
+            ) for i, (name, origin, dihedral, incidence) in enumerate(zip(self.names, self.origin, self.dihedral, self.incidence))
+        ], self.symm)
+
+    def copy(self):
+        return Planform(
+            self.names, self.origin.copy(), self.dihedral.copy(), self.incidence.copy(),
+            self.le.copy(), self.chord.copy(), self.twist.copy(), self.te_thickness.copy(),
+            self.airfoil.copy(), self.airfoils, self.symm
+        )
+
+    def scale(self, fac: float):
+        pf = self.copy()
+        for arr in [pf.origin, pf.le, pf.chord, pf.te_thickness]:
+            arr *= fac
+        return pf
+
+    @property
+    def semispan(self) -> np.ndarray:
+        return self.le[:, 1, 1] - self.le[:, 0, 1]
+
+    @property
+    def ymax(self) -> np.ndarray:
+        return self.le[:, 1, 1] + self.origin[:, 1]
+
+    @property
+    def panel_SMC(self) -> np.ndarray:
+        return self.chord.mean(axis=1)
+
+    @property
+    def area(self) -> np.ndarray:
+        return self.panel_SMC * self.semispan
+
+    @property
+    def taper_ratio(self) -> np.ndarray:
+        return self.chord[:, 1] / self.chord[:, 0]
+
+    @property
+    def le_sweep_distance(self) -> np.ndarray:
+        return self.le[:, 1, 0] - self.le[:, 0, 0]
+
+    @property
+    def le_sweep_angle(self) -> np.ndarray:
+        return np.arctan2(self.le_sweep_distance, self.semispan)
+
+    @property
+    def panel_MAC(self) -> np.ndarray:
+        t = self.taper_ratio
+        return (2/3) * self.chord[:, 0] * (1 + t + t**2) / (1 + t)
+
+    @property
+    def panel_pMAC(self) -> np.ndarray:
+        """(n, 3) position of each panel MAC leading edge in its panel frame"""
+        t = self.taper_ratio
+        ymac = (1/3) * (1 + 2*t) / (1 + t)
+        return np.column_stack([ymac * self.le_sweep_distance / self.semispan, ymac, np.zeros(len(t))])
+
+    def panel_props(self) -> pd.DataFrame:
+        """The PanelProps of every panel as a table"""
+        pmac = self.panel_pMAC
+        return pd.DataFrame(dict(
+            ymax=self.ymax,
+            semispan=self.semispan,
+            SMC=self.panel_SMC,
+            area=self.area,
+            taper_ratio=self.taper_ratio,
+            le_sweep_distance=self.le_sweep_distance,
+            le_sweep_angle=self.le_sweep_angle,
+            incidence=self.incidence,
+            dihedral=self.dihedral,
+            MAC=self.panel_MAC,
+            pMACx=pmac[:, 0],
+            pMACy=pmac[:, 1],
+        ), index=self.names)
+
+    @property
+    def S(self) -> float:
+        return np.sum(self.area) * (2 if self.symm else 1)
+
+    @property
+    def b(self) -> float:
+        return self.ymax[-1] * (2 if self.symm else 1)
+
+    @property
+    def AR(self) -> float:
+        return self.b**2 / self.S
+
+    @property
+    def SMC(self) -> float:
+        return self.S / self.b
+
+    @property
+    def tr(self) -> float:
+        return self.chord[-1, 1] / self.chord[0, 0]
+
+    @property
+    def MAC(self) -> float:
+        return np.sum(self.panel_MAC * self.area) / (self.S / 2)
+
+    @property
+    def pMAC(self) -> np.ndarray:
+        """x, y, 0 of the wing MAC, weighted as in WingProps"""
+        pmac = self.panel_pMAC + self.origin * [1, 1, 0]
+        return np.sum(pmac * self.area[:, None], axis=0) / (self.S / 2)
@@ -1,32 +1,56 @@
 from acdesign.airfoils.airfoil import Airfoil
+from acdesign.airfoils.shapes import Section
 from geometry import Transformation, Point, Quaternion, Euler, P0
 import numpy as np
+from .fingerprint import Fingerprinted
 
 
-class Rib(Airfoil):
-    def __init__(self, transform: Transformation, *args, **kwargs):
+class Rib(Airfoil, Fingerprinted):
+    def __init__(self, transform: Transformation, name: str, points: Point=None, section: Section=None):
         """A rib represents a positioned airfoil
 
         Args:
             transform (Transformation): position of airfoil relative to panel
-            airfoil (Airfoil): represents the section points
+            name (str): the airfoil name
+            points (Point, optional): the section points
+            section (Section, optional): a shared shape, chord and te thickness to 
+                calculate the points from when they are needed, in place of points.
         """
         self.transform = transform
-        super().__init__(*args, **kwargs)
-
+        self.name = name
+        self._points = points
+        self.section = section
+        self._incidence = None
 
     def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(f"Attribute {name} not found")
         if name in self.transform.cols:
             return getattr(self.transform, name)
-        
+
+    @property
+    def points(self) -> Point:
+        return self._points if self.section is None else self.section.points
+
+    @property
+    def chord(self):
+        return super().chord if self.section is None else self.section.chord
+
+    @property
+    def te_thickness(self):
+        return super().te_thickness if self.section is None else self.section.te_thickness
+
+    def _copy(self, transform: Transformation, name: str=None, incidence: float=None):
+        rib = Rib(transform, name or self.name, self._points, self.section)
+        rib._incidence = incidence
+        return rib
+
     @staticmethod
     def simple(airfoil: str, chord: float, te_thickness: float):
         return Rib(
             Transformation.build(P0(),Euler(np.pi/2, 0, 0)),
             airfoil,
-            Airfoil.download(airfoil.split("_")[-1])
-            .set_chord(chord)
-            .set_te_thickness(te_thickness).points
+            section=Section.create(airfoil.split("_")[-1], chord, te_thickness)
         )
 
     @staticmethod
@@ -37,9 +61,7 @@ class Rib(Airfoil):
                 Euler(np.pi/2, 0, np.radians(incidence))
             ),
             airfoil,
-            Airfoil.download(airfoil.split("_")[-1])
-            .set_chord(chord)
-            .set_te_thickness(te_thickness).points
+            section=Section.create(airfoil.split("_")[-1], chord, te_thickness)
         )
 
     def dumpd(self):
@@ -51,28 +73,30 @@ class Rib(Airfoil):
         )
 
     def rename(self, name):
-        return Rib(self.transform,name, self.points)
+        return self._copy(self.transform, name, self._incidence)
 
     def offset(self, pos):
-        return Rib(
+        return self._copy(
             Transformation.build(self.transform.translation + pos, self.transform.rotation),
-            self.name, self.points
+            incidence=self._incidence
         )
     
     def apply_transformation(self, trans: Transformation):
-        return Rib(
-            trans.apply(self.transform),
-            self.name, self.points
-        )
+        return self._copy(trans.apply(self.transform))
 
     @property
     def incidence(self):
-        cline = self.transform.rotate(Point(1,0,0))
-        return np.arctan2(cline.y[0], cline.x[0])
+        if self._incidence is None:
+            cline = self.transform.rotate(Point(1,0,0))
+            self._incidence = np.arctan2(cline.y[0], cline.x[0])
+        return self._incidence
 
     def scale(self, fac: float):
-        return Rib(
+        rib = Rib(
             Transformation(self.transform.translation * fac, self.transform.rotation),
             self.name,
-            self.points * fac
-        )
\ No newline at end of file
+            None if self.section is not None else self._points * fac,
+            None if self.section is None else self.section.scale(fac)
+        )
+        rib._incidence = self._incidence
+        return rib
\ No newline at end of file
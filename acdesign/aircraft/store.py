@@ -0,0 +1,211 @@
+import json
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple, Union
+from acdesign.airfoils.cache import atomic_savez, range_mask
+from .plane import Plane, ConventionalPlane
+from .wing import Wing
+
+
+schema = dict(
+    designs=dict(
+        variant=int, name=str, S=float, b=float, AR=float, MAC=float,
+        sref=float, bref=float, cref=float, panels=int
+    ),
+    panels=dict(
+        variant=int, panel=int, name=str, x=float, y=float, z=float,
+        dihedral=float, incidence=float, length=float, sweep=float, area=float
+    ),
+    ribs=dict(variant=int, panel=int, rib=int, airfoil=str, chord=float, te_thickness=float, incidence=float),
+    bodies=dict(variant=int, name=str, x=float, y=float, z=float),
+    masses=dict(variant=int, name=str, x=float, y=float, z=float, m=float, geom=str),
+)
+
+
+def _wing(plane: Plane):
+    """main wing props, from the panels with wing in their name unless the plane has a wing"""
+    wing = plane.wing if isinstance(plane, ConventionalPlane) else \
+        Wing([p for p in plane.panels if "wing" in p.name])
+    return wing.props if len(wing.panels) else None
+
+
+def tabulate(planes: Iterable[Plane], start: int=0) -> Dict[str, pd.DataFrame]:
+    """Flatten planes into one table per component type, keyed on a variant id
+    counting up from start. The designs table has a row per plane with the main wing
+    props and the reference dimensions. Panels, ribs, bodies and masses are long tables
+    with a row per component, so each column holds a single dtype.
+    """
+    rows = {k: [] for k in schema}
+    for variant, plane in enumerate(planes, start):
+        data = plane.dumpd()
+        wing = _wing(plane)
+        rows["designs"].append((
+            variant, plane.name, *([wing.S, wing.b, wing.AR, wing.MAC] if wing else [np.nan] * 4),
+            plane.sref, plane.bref, plane.cref, len(plane.panels)
+        ))
+        for i, (panel, pdata) in enumerate(zip(plane.panels, data["panels"])):
+            acpos = pdata["acpos"]
+            rows["panels"].append((
+                variant, i, pdata["name"], acpos["x"], acpos["y"], acpos["z"], pdata["dihedral"],
+                pdata["incidence"], pdata["length"], pdata["sweep"], panel.area
+            ))
+            for j, rdata in enumerate([pdata["inbd"], pdata["otbd"]]):
+                rows["ribs"].append((variant, i, j, rdata["airfoil"], rdata["chord"], rdata["te_thickness"], rdata["incidence"]))
+        for bdata in data["bodies"]:
+            acpos = bdata["acpos"]
+            rows["bodies"].append((variant, bdata["name"], acpos["x"], acpos["y"], acpos["z"]))
+        for mdata in data["masses"]:
+            cg = mdata["cg"]
+            rows["masses"].append((variant, mdata["name"], cg["x"], cg["y"], cg["z"], mdata["m"], json.dumps(mdata["geom"])))
+    return {k: _frame(k, v) for k, v in rows.items()}
+
+
+def _frame(table: str, rows: list) -> pd.DataFrame:
+    cols = schema[table]
+    data = list(zip(*rows)) if rows else [[] for _ in cols]
+    return pd.DataFrame({c: np.array(v, dtype=t) for (c, t), v in zip(cols.items(), data)})
+
+
+class DesignStore:
+    def __init__(self, path: Union[str, Path]):
+        """A directory of design variants held as columnar tables in chunk files. Each
+        chunk is an npz archive with an array per table column, so queries only read the
+        columns they need and a single variant is rebuilt from the one chunk holding it.
+
+        Args:
+            path (Union[str, Path]): store directory, created on first append
+        """
+        self.path = Path(path)
+        self._index = None
+
+    @property
+    def chunks(self) -> List[Path]:
+        """chunk files, in variant order"""
+        return sorted(self.path.glob("chunk_*.npz"))
+
+    @staticmethod
+    def _first(chunk: Path) -> int:
+        return int(chunk.stem.split("_")[1])
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, variant: int) -> bool:
+        return variant in self.index.index
+
+    @property
+    def variants(self) -> np.ndarray:
+        return self.index.index.to_numpy()
+
+    def append(self, planes: Iterable[Plane], chunksize: int=1000) -> List[int]:
+        """Add planes to the store, writing a chunk file for every chunksize of them.
+
+        Returns:
+            List[int]: the variant ids given to the planes
+        """
+        start = int(self.variants.max()) + 1 if len(self) else 0
+        ids, block = [], []
+        for plane in planes:
+            block.append(plane)
+            if len(block) == chunksize:
+                ids.extend(self._write(block, start + len(ids)))
+                block = []
+        if block:
+            ids.extend(self._write(block, start + len(ids)))
+        return ids
+
+    def _write(self, planes: List[Plane], start: int) -> range:
+        tables = tabulate(planes, start)
+        atomic_savez(self.path / f"chunk_{start:09d}.npz", **{
+            f"{table}.{col}": df[col].to_numpy(dtype=t)
+            for table, df in tables.items() for col, t in schema[table].items()
+        })
+        self._index = None
+        return range(start, start + len(planes))
+
+    @staticmethod
+    def _read(chunk: Path, table: str, columns: List[str]=None) -> pd.DataFrame:
+        with np.load(chunk, allow_pickle=False) as npz:
+            return pd.DataFrame({c: npz[f"{table}.{c}"] for c in columns or schema[table]})
+
+    def table(self, table: str, columns: List[str]=None) -> pd.DataFrame:
+        """One table of every chunk, reading only the requested columns"""
+        frames = [DesignStore._read(chunk, table, columns) for chunk in self.chunks]
+        return pd.concat(frames, ignore_index=True) if frames else \
+            _frame(table, []).loc[:, columns or list(schema[table])]
+
+    @property
+    def index(self) -> pd.DataFrame:
+        """The designs table indexed on variant, read once and kept until the next append"""
+        if self._index is None:
+            self._index = self.table("designs").set_index("variant")
+        return self._index
+
+    def mask(self, airfoils: Dict[str, str]=None, **ranges: Tuple[float, float]) -> np.ndarray:
+        """rows of the index with each named column within (lower, upper), None for no bound.
+        airfoils maps part of a panel name to an airfoil that at least one rib of a matching
+        panel must use, for example dict(tail="e472-il"). Airfoil names are not case sensitive."""
+        data = self.index
+        sel = range_mask(data, **ranges)
+        if airfoils:
+            ribs = self.table("ribs", ["variant", "panel", "airfoil"]).merge(
+                self.table("panels", ["variant", "panel", "name"]), on=["variant", "panel"]
+            )
+            for panel, airfoil in airfoils.items():
+                match = ribs.name.str.contains(panel, regex=False) & (ribs.airfoil.str.lower() == airfoil.lower())
+                sel &= data.index.isin(ribs.variant[match])
+        return sel
+
+    def query(self, airfoils: Dict[str, str]=None, **ranges: Tuple[float, float]) -> pd.DataFrame:
+        """Summary rows of the designs matching the given ranges and airfoils, for example
+        query(dict(tail="e472-il"), AR=(8, 10))
+        """
+        return self.index.loc[self.mask(airfoils, **ranges)]
+
+    def _chunk(self, variant: int) -> Path:
+        chunks = self.chunks
+        i = np.searchsorted([DesignStore._first(c) for c in chunks], variant, side="right") - 1
+        if variant not in self or i < 0:
+            raise KeyError(f"variant {variant} is not in the store")
+        return chunks[i]
+
+    def dumpd(self, variant: int) -> dict:
+        """The Plane.dumpd structure of one variant, read from its chunk"""
+        chunk = self._chunk(variant)
+        tables = {
+            k: df.loc[df.variant == variant].drop(columns="variant")
+            for k, df in ((k, DesignStore._read(chunk, k)) for k in schema)
+        }
+        ribs = tables["ribs"].sort_values(["panel", "rib"])
+
+        def rib(r):
+            return dict(airfoil=r.airfoil, chord=r.chord, te_thickness=r.te_thickness, incidence=r.incidence)
+
+        return dict(
+            version=0.01,
+            name=tables["designs"].name.iloc[0],
+            panels=[dict(
+                name=p.name,
+                acpos=dict(x=p.x, y=p.y, z=p.z),
+                dihedral=p.dihedral,
+                incidence=p.incidence,
+                length=p.length,
+                sweep=p.sweep,
+                inbd=rib(ribs.loc[(ribs.panel == p.panel) & (ribs.rib == 0)].iloc[0]),
+                otbd=rib(ribs.loc[(ribs.panel == p.panel) & (ribs.rib == 1)].iloc[0]),
+            ) for p in tables["panels"].sort_values("panel").itertuples()],
+            bodies=[
+                dict(name=b.name, acpos=dict(x=b.x, y=b.y, z=b.z))
+                for b in tables["bodies"].itertuples()
+            ],
+            masses=[
+                dict(name=m.name, cg=dict(x=m.x, y=m.y, z=m.z), m=m.m, geom=json.loads(m.geom))
+                for m in tables["masses"].itertuples()
+            ],
+        )
+
+    def get(self, variant: int, conventional: bool=True) -> Plane:
+        """Rebuild one variant, as a ConventionalPlane or a Plane"""
+        data = self.dumpd(variant)
+        return ConventionalPlane.from_dict(data) if conventional else Plane.create(**data)
@@ -1,5 +1,8 @@
 from re import T
 from acdesign.aircraft import Panel, Rib
+from acdesign.aircraft.lazy import Lazy
+from acdesign.aircraft.frames import RibFrames
+from acdesign.aircraft.fingerprint import Fingerprinted
 from typing import List, Union
 from geometry import Point, P0, Transformation, Euler, PY, Q0
 import numpy as np
@@ -26,17 +29,35 @@ class WingProps:
         self.pMAC = Point(xMAC, yMAC, 0)
 
 
-class Wing:
+class Wing(Fingerprinted):
     def __init__(self, panels: List[Panel], symm=True):
         self.panels = panels
         self.symm=symm
-        self.props = WingProps(self)
+        self._props = Lazy(WingProps, self)
+        self._rib_frames = Lazy(RibFrames.build, panels)
+
+    @property
+    def props(self) -> WingProps:
+        return self._props()
+
+    @property
+    def rib_frames(self) -> RibFrames:
+        """body frame position and orientation of every rib, calculated together on first access"""
+        return self._rib_frames()
 
     def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(f"Attribute {name} not found")
         if name in self.props.__dict__:
             return getattr(self.props, name)
         raise AttributeError(f"Attribute {name} not found")
 
+    def dumpd(self):
+        return dict(
+            panels=[p.dumpd() for p in self.panels],
+            symm=self.symm
+        )
+
     def scale(self, fac):
         return Wing([p.scale(fac) for p in self.panels], self.symm)
 
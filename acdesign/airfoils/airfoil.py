@@ -3,6 +3,32 @@ from urllib.error import HTTPError
 from geometry import Point, PX, PY
 import numpy as np
 from scipy.interpolate import interp1d
+from pkg_resources import resource_string
+from typing import Dict, List, Tuple
+from .cache import coordinate_cache
+
+
+def selig_coords(text: str) -> Tuple[str, np.ndarray]:
+    """Read the name and (n, 2) coordinates from the text of a Selig or Lednicer 
+    format file. The numeric part is converted in one numpy call.
+    Lednicer files (a line of upper and lower point counts, then the upper surface
+    and lower surface from the leading edge) are reordered to Selig order.
+    """
+    name, _, body = text.strip().partition("\n")
+    data = np.array(body.split(), dtype=float)
+    if len(data) % 2 != 0:
+        raise ValueError(f"odd number of values in coordinates of {name.strip()}")
+    data = data.reshape(-1, 2)
+
+    if np.all(data[0] > 1) and np.all(data[0] == np.round(data[0])):
+        nu = int(data[0, 0])
+        d1 = data[1:nu + 1]
+        d2 = data[nu + 1:]
+        if np.all(d1[0] == d2[0]):
+            d1 = d1[1:]
+        data = np.concatenate([d1[::-1], d2])
+
+    return name.strip(), data
 
 
 class Airfoil:
@@ -12,25 +38,12 @@ class Airfoil:
 
     @staticmethod
     def parse_selig(file):      
-                
         with open(file) as f:
-            lines = [l.strip()  for l in f.readlines()]
-        name = lines[0]
-        lines = lines[1:]
-
-        if lines[1] == "":
-            npoints = np.array([float(v) for v in lines[0].split()]).astype("int")
-
-            lines = lines[2:]
-            
-            d1 = lines[:npoints[0]]            
-            d2 = lines[npoints[0]+1:]
-            if d1[0] == d2[0]:
-                d1 = d1[1:]
-            lines = list(reversed(d1)) + d2
-
-        data = np.array([l.split()  for l in lines]).astype(float)
+            return Airfoil.from_selig_text(f.read())
 
+    @staticmethod
+    def from_selig_text(text: str):
+        name, data = selig_coords(text)
         return Airfoil(
             name, 
             Point(
@@ -39,15 +52,26 @@ class Airfoil:
         )
 
     @staticmethod
-    def download(airfoiltoolsname):
+    def _get_uiuc_file(name: str) -> str:
         #https://m-selig.ae.illinois.edu/ads/coord_updates/la5055.dat
+        return urllib.request.urlretrieve(f"https://m-selig.ae.illinois.edu/ads/coord/{name}.dat")[0]
+
+    @staticmethod
+    def coordinate_name(airfoiltoolsname: str) -> str:
         if airfoiltoolsname[-3:] == "-il":
-            airfoiltoolsname = airfoiltoolsname[:-3]
-#            _file = urllib.request.urlretrieve("http://airfoiltools.com/airfoil/seligdatfile?airfoil=" + airfoiltoolsname)            
+            return airfoiltoolsname[:-3]
+        return airfoiltoolsname
 
- #       else:
-        _file = urllib.request.urlretrieve(f"https://m-selig.ae.illinois.edu/ads/coord/{airfoiltoolsname}.dat")
-        return Airfoil.parse_selig(_file[0])
+    @staticmethod
+    def download(airfoiltoolsname):
+        """Coordinates from the UIUC database, through the local coordinate cache.
+        See acdesign.airfoils.cache.CoordinateCache for the offline and mirror options.
+        """
+#            _file = urllib.request.urlretrieve("http://airfoiltools.com/airfoil/seligdatfile?airfoil=" + airfoiltoolsname)            
+        return Airfoil.parse_selig(coordinate_cache.read(
+            Airfoil.coordinate_name(airfoiltoolsname), 
+            Airfoil._get_uiuc_file
+        ))
 
     @property
     def le_point(self):
@@ -96,7 +120,7 @@ class Airfoil:
         return interp1d(self.top_surface.x, self.top_surface.y, "cubic", fill_value="extrapolate")
 
     def btm_func(self):
-        return interp1d(self.top_surface.x, self.top_surface.y, "cubic", fill_value="extrapolate")
+        return interp1d(self.btm_surface.x, self.btm_surface.y, "cubic", fill_value="extrapolate")
 
     def mean_camber(self):
         btms = self.btm_surface
@@ -106,7 +130,28 @@ class Airfoil:
         return 0.5 * (btms + tops)
 
 
+def uiuc_names() -> List[str]:
+    """airfoil names in the packaged uiuc list, lower case to match the coordinate files"""
+    return resource_string("acdesign", "airfoils/uiuc_list.txt").decode().lower().split()
+
+
+def prefetch(names: List[str]=None) -> Dict[str, str]:
+    """Download coordinates into the local cache so geometry can be built offline.
 
+    Args:
+        names (List[str], optional): airfoils to fetch. Defaults to uiuc_names().
 
+    Returns:
+        Dict[str, str]: names that failed, with the error
+    """
+    return coordinate_cache.prefetch(
+        [Airfoil.coordinate_name(n) for n in (names or uiuc_names())], 
+        Airfoil._get_uiuc_file
+    )
 
 
+if __name__ == '__main__':
+    import sys
+    failed = prefetch(sys.argv[1:] or None)
+    for name, err in failed.items():
+        print(f"{name}: {err}")
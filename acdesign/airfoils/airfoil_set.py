@@ -0,0 +1,152 @@
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import List, Union
+from geometry import Point
+from .airfoil import Airfoil
+
+
+def cosine_spacing(m: int) -> np.ndarray:
+    """m chordwise stations from 0 to 1, clustered at the leading and trailing edges"""
+    return 0.5 * (1 - np.cos(np.linspace(0, np.pi, m)))
+
+
+class AirfoilSet:
+    def __init__(self, names: List[str], x: np.ndarray, upper: np.ndarray, lower: np.ndarray):
+        """Many unit chord airfoils resampled onto a common chordwise distribution,
+        so that geometric properties of the whole set are single array operations.
+
+        Args:
+            names (List[str]): airfoil names
+            x (np.ndarray): (m,) chordwise stations, 0 at the leading edge, 1 at the trailing edge
+            upper (np.ndarray): (n, m) upper surface y at each station
+            lower (np.ndarray): (n, m) lower surface y at each station
+        """
+        self.names = list(names)
+        self.x = x
+        self.upper = upper
+        self.lower = lower
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def coords(self) -> np.ndarray:
+        """(n, 2m-1, 2) coordinates in Selig order, trailing edge over the top to the trailing edge"""
+        xs = np.concatenate([self.x[::-1], self.x[1:]])
+        ys = np.concatenate([self.upper[:, ::-1], self.lower[:, 1:]], axis=1)
+        return np.stack([np.broadcast_to(xs, ys.shape), ys], axis=2)
+
+    @staticmethod
+    def _resample(af: Airfoil, x: np.ndarray):
+        return AirfoilSet.resample_coords(np.column_stack([af.points.x, af.points.y]), x)
+
+    @staticmethod
+    def resample_coords(coords: np.ndarray, x: np.ndarray):
+        """upper and lower surface y at stations x from (n, 2) Selig ordered coordinates"""
+        px, py = coords[:, 0], coords[:, 1]
+        ile = int(np.argmin(px))
+        chord = px.max() - px[ile]
+        px = (px - px[ile]) / chord
+        py = (py - py[ile]) / chord
+        ux, uy = px[:ile + 1][::-1], py[:ile + 1][::-1]
+        lx, ly = px[ile:], py[ile:]
+        if not (chord > 0 and np.all(np.isfinite(coords))):
+            raise ValueError("coordinates do not describe an airfoil")
+        return np.interp(x, ux, uy), np.interp(x, lx, ly)
+
+    @staticmethod
+    def from_airfoils(airfoils: List[Airfoil], m: int=101):
+        x = cosine_spacing(m)
+        surfaces = [AirfoilSet._resample(af, x) for af in airfoils]
+        return AirfoilSet(
+            [af.name for af in airfoils],
+            x,
+            np.array([s[0] for s in surfaces]).reshape(-1, m),
+            np.array([s[1] for s in surfaces]).reshape(-1, m),
+        )
+
+    @staticmethod
+    def from_directory(directory: Union[str, Path], pattern: str="*.dat", m: int=101):
+        return AirfoilSet.from_airfoils(
+            [Airfoil.parse_selig(f) for f in sorted(Path(directory).glob(pattern))], m
+        )
+
+    def __getitem__(self, i: int) -> Airfoil:
+        c = self.coords[i]
+        return Airfoil(self.names[i], Point(np.column_stack([c, np.zeros(len(c))])))
+
+    def _trapz(self, y: np.ndarray) -> np.ndarray:
+        return np.trapz(y, self.x, axis=-1)
+
+    @property
+    def thickness(self) -> np.ndarray:
+        """(n, m) thickness distribution"""
+        return self.upper - self.lower
+
+    @property
+    def camber(self) -> np.ndarray:
+        """(n, m) mean camber line"""
+        return 0.5 * (self.upper + self.lower)
+
+    @property
+    def max_thickness(self) -> np.ndarray:
+        return self.thickness.max(axis=1)
+
+    @property
+    def max_thickness_x(self) -> np.ndarray:
+        return self.x[self.thickness.argmax(axis=1)]
+
+    @property
+    def max_camber(self) -> np.ndarray:
+        return self.camber.max(axis=1)
+
+    @property
+    def max_camber_x(self) -> np.ndarray:
+        return self.x[self.camber.argmax(axis=1)]
+
+    @property
+    def le_radius(self) -> np.ndarray:
+        """leading edge radius, from t = 2 sqrt(2 r x) close to the leading edge"""
+        near = (self.x > 0) & (self.x <= 0.005)
+        if not np.any(near):
+            near = np.arange(len(self.x)) == 1
+        return np.mean(self.thickness[:, near]**2 / (8 * self.x[near]), axis=1)
+
+    @property
+    def area(self) -> np.ndarray:
+        """cross sectional area"""
+        return self._trapz(self.thickness)
+
+    @property
+    def centroid(self) -> np.ndarray:
+        """(n, 2) x, y of the centroid of the section"""
+        a = self.area
+        return np.column_stack([
+            self._trapz(self.x * self.thickness) / a,
+            self._trapz(0.5 * (self.upper**2 - self.lower**2)) / a,
+        ])
+
+    @property
+    def inertia(self) -> np.ndarray:
+        """(n, 2) second moments of area about the centroid, Ixx (flapwise) and Iyy (chordwise)"""
+        a = self.area
+        c = self.centroid
+        return np.column_stack([
+            self._trapz((self.upper**3 - self.lower**3) / 3) - a * c[:, 1]**2,
+            self._trapz(self.x**2 * self.thickness) - a * c[:, 0]**2,
+        ])
+
+    def summary(self) -> pd.DataFrame:
+        """Scalar properties of every airfoil in the set, per unit chord"""
+        inertia = self.inertia
+        return pd.DataFrame(dict(
+            max_thickness=self.max_thickness,
+            max_thickness_x=self.max_thickness_x,
+            max_camber=self.max_camber,
+            max_camber_x=self.max_camber_x,
+            le_radius=self.le_radius,
+            area=self.area,
+            Ixx=inertia[:, 0],
+            Iyy=inertia[:, 1],
+        ), index=self.names)
@@ -0,0 +1,201 @@
+import os
+import shutil
+import hashlib
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, List, Tuple, Union
+
+
+def cache_dir(*sub: str) -> Path:
+    """Directory within the acdesign user cache. The root is $ACDESIGN_CACHE if set,
+    otherwise ~/.cache/acdesign.
+    """
+    return Path(os.environ.get("ACDESIGN_CACHE", Path.home() / ".cache" / "acdesign")).joinpath(*sub)
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").lower() in ["1", "true", "yes"]
+
+
+def atomic_write(path: Union[str, Path], write: Callable[[BinaryIO], None]) -> Path:
+    """Write a file through write(f) on a temporary file that replaces path once complete,
+    so readers in other processes never see a partly written file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        write(f)
+    os.replace(tmp, path)
+    return path
+
+
+def atomic_savez(path: Union[str, Path], **arrays: np.ndarray) -> Path:
+    """np.savez to path, through atomic_write"""
+    return atomic_write(path, lambda f: np.savez(f, **arrays))
+
+
+def range_mask(data: pd.DataFrame, **ranges: Tuple[float, float]) -> np.ndarray:
+    """rows of data with each named column within (lower, upper), None for no bound"""
+    sel = np.ones(len(data), dtype=bool)
+    for col, (lower, upper) in ranges.items():
+        values = data[col].to_numpy()
+        if lower is not None:
+            sel &= values >= lower
+        if upper is not None:
+            sel &= values <= upper
+    return sel
+
+
+def file_hash(file: Union[str, Path]) -> str:
+    with open(file, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+class PolarCache:
+    # part of every cache file name, increase it when the parsed format changes
+    version = 2
+
+    def __init__(self, directory: Union[str, Path]=None):
+        """Compiled binary copies of parsed polar files, keyed on a hash of the
+        source file and the parser version, so an edited file or a changed parser
+        causes the file to be re-parsed automatically.
+
+        Args:
+            directory (Union[str, Path], optional): where to store the cache.
+                Defaults to cache_dir("polars"), resolved when first used.
+        """
+        self._directory = directory
+
+    @property
+    def directory(self) -> Path:
+        return Path(self._directory) if self._directory else cache_dir("polars")
+
+    def path(self, file: Union[str, Path]) -> Path:
+        return self.directory / f"{Path(file).name}.{file_hash(file)}.v{self.version}.npz"
+
+    @staticmethod
+    def save(path: Path, df: pd.DataFrame):
+        atomic_savez(
+            path,
+            data=df.to_numpy(dtype=float),
+            columns=np.array(df.columns, dtype=str),
+            index=df.index.to_numpy(),
+        )
+
+    @staticmethod
+    def load(path: Path) -> pd.DataFrame:
+        with np.load(path, allow_pickle=False) as npz:
+            return pd.DataFrame(npz["data"], columns=list(npz["columns"]), index=npz["index"])
+
+    def read(self, file: Union[str, Path], parse: Callable[[str], pd.DataFrame]) -> pd.DataFrame:
+        """Read a polar file from the cache, parsing and caching it on a miss.
+
+        Args:
+            file (Union[str, Path]): the source text file
+            parse (Callable[[str], pd.DataFrame]): parser to use on a cache miss
+        """
+        path = self.path(file)
+        if path.exists():
+            return PolarCache.load(path)
+        df = parse(file)
+        try:
+            PolarCache.save(path, df)
+        except OSError:
+            pass
+        return df
+
+
+polar_cache = PolarCache()
+
+
+class CoordinateCache:
+    def __init__(self, directory: Union[str, Path]=None, mirror: Union[str, Path]=None, offline: bool=None):
+        """Content addressed store of airfoil coordinate files. Files are kept as
+        objects/<sha1>.dat, with names/<airfoil name> holding the hash for each name.
+
+        Args:
+            directory (Union[str, Path], optional): location of the cache. 
+                Defaults to cache_dir("airfoils").
+            mirror (Union[str, Path], optional): directory of <name>.dat files to use 
+                before downloading. Defaults to $ACDESIGN_AIRFOIL_MIRROR.
+            offline (bool, optional): never download, only read from the cache or 
+                mirror. Defaults to $ACDESIGN_OFFLINE.
+        """
+        self._directory = directory
+        self._mirror = mirror
+        self._offline = offline
+
+    @property
+    def directory(self) -> Path:
+        return Path(self._directory) if self._directory else cache_dir("airfoils")
+
+    @property
+    def mirror(self) -> Union[Path, None]:
+        mirror = self._mirror or os.environ.get("ACDESIGN_AIRFOIL_MIRROR")
+        return Path(mirror) if mirror else None
+
+    @property
+    def offline(self) -> bool:
+        return _env_flag("ACDESIGN_OFFLINE") if self._offline is None else self._offline
+
+    def lookup(self, name: str) -> Union[Path, None]:
+        """path to the cached file for a name, None if it is not in the cache"""
+        ref = self.directory / "names" / name
+        if ref.exists():
+            obj = self.directory / "objects" / f"{ref.read_text().strip()}.dat"
+            if obj.exists():
+                return obj
+
+    def names(self) -> List[str]:
+        """names of all the airfoils in the cache"""
+        refs = self.directory / "names"
+        return sorted(f.name for f in refs.iterdir()) if refs.exists() else []
+
+    def hashes(self) -> Dict[str, str]:
+        """name: object hash of all the airfoils in the cache, sorted by name"""
+        refs = self.directory / "names"
+        return {name: (refs / name).read_text().strip() for name in self.names()}
+
+    def store(self, name: str, file: Union[str, Path]) -> Path:
+        obj = self.directory / "objects" / f"{file_hash(file)}.dat"
+        ref = self.directory / "names" / name
+        if not obj.exists():
+            with open(file, "rb") as src:
+                atomic_write(obj, lambda f: shutil.copyfileobj(src, f))
+        ref.parent.mkdir(parents=True, exist_ok=True)
+        ref.write_text(obj.stem)
+        return obj
+
+    def read(self, name: str, download: Callable[[str], str]) -> Path:
+        """Path to a coordinate file, from the cache, the mirror or by downloading it.
+
+        Args:
+            name (str): airfoil name
+            download (Callable[[str], str]): fetches the file for a name, returning a local path
+        """
+        cached = self.lookup(name)
+        if cached is not None:
+            return cached
+        if self.mirror is not None and (self.mirror / f"{name}.dat").exists():
+            return self.mirror / f"{name}.dat"
+        if self.offline:
+            raise FileNotFoundError(f"airfoil {name} is not in the cache or mirror and downloads are disabled")
+        file = download(name)
+        try:
+            return self.store(name, file)
+        except OSError:
+            return Path(file)
+
+    def prefetch(self, names: List[str], download: Callable[[str], str]) -> Dict[str, str]:
+        """Fill the cache, returning the names that could not be fetched with the error"""
+        failed = {}
+        for name in names:
+            try:
+                self.read(name, download)
+            except Exception as ex:
+                failed[name] = str(ex)
+        return failed
+
+
+coordinate_cache = CoordinateCache()
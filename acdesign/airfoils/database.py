@@ -0,0 +1,108 @@
+import json
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+from .polar import UIUCPolars, LFTDRGParser
+from .cache import PolarCache, polar_cache
+
+
+class PolarDatabase:
+    columns = ["airfoil", "re", "alpha", "Cl", "Cd", "Cm", "pre_stall"]
+
+    def __init__(self, data: np.ndarray, index: Dict[str, List[int]], grid: Tuple[int, int]=None):
+        """Lift and drag tables for many airfoils in one contiguous float array.
+
+        Lift rows have Cd = nan and drag rows have Cm = nan. Opened with
+        PolarDatabase.open the array is memory-mapped, so only the rows of
+        airfoils that are used are read from disk and worker processes share
+        the operating system's page cache rather than holding their own copy.
+
+        Args:
+            data (np.ndarray): (n, 7) array of rows, see PolarDatabase.columns
+            index (Dict[str, List[int]]): airfoil name: [lift start, lift stop, drag start, drag stop]
+            grid (Tuple[int, int], optional): passed to the UIUCPolars created. Defaults to None.
+        """
+        self.data = data
+        self.index = index
+        self.grid = grid
+        self._polars = {}
+
+    @property
+    def names(self) -> List[str]:
+        return list(self.index.keys())
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def _table(self, start: int, stop: int, cols: List[str]) -> pd.DataFrame:
+        ids = [PolarDatabase.columns.index(c) for c in cols]
+        return pd.DataFrame(np.array(self.data[start:stop, ids]), columns=cols)
+
+    def lift(self, name: str) -> pd.DataFrame:
+        ls, le, _, _ = self.index[name]
+        return self._table(ls, le, ["alpha", "Cl", "Cm", "re", "pre_stall"])
+
+    def drag(self, name: str) -> pd.DataFrame:
+        _, _, ds, de = self.index[name]
+        return self._table(ds, de, ["alpha", "Cl", "Cd", "re", "pre_stall"])
+
+    def __getitem__(self, name: str) -> UIUCPolars:
+        """UIUCPolars for an airfoil, built on first access and then reused"""
+        if name not in self._polars:
+            self._polars[name] = UIUCPolars(self.lift(name), self.drag(name), self.grid)
+        return self._polars[name]
+
+    @staticmethod
+    def _rows(aid: int, df: pd.DataFrame) -> np.ndarray:
+        rows = np.full((len(df), len(PolarDatabase.columns)), np.nan)
+        rows[:, 0] = aid
+        for i, col in enumerate(PolarDatabase.columns[1:], 1):
+            if col in df.columns:
+                rows[:, i] = df[col].to_numpy()
+        return rows
+
+    @staticmethod
+    def pack(directory: Union[str, Path], cache: PolarCache=polar_cache):
+        """Pack every LFT/DRG pair in a directory into a PolarDatabase"""
+        read = LFTDRGParser.parse_file if cache is None else \
+            lambda f: cache.read(f, LFTDRGParser.parse_file)
+
+        blocks, index, n = [], {}, 0
+        for lft in sorted(Path(directory).glob("*.LFT")):
+            drg = lft.with_suffix(".DRG")
+            if not drg.exists():
+                continue
+            lift, drag = read(lft), read(drg)
+            aid = len(index)
+            index[lft.stem] = [n, n + len(lift), n + len(lift), n + len(lift) + len(drag)]
+            blocks += [PolarDatabase._rows(aid, lift), PolarDatabase._rows(aid, drag)]
+            n = index[lft.stem][-1]
+        return PolarDatabase(np.concatenate(blocks), index)
+
+    def save(self, path: Union[str, Path]):
+        """write the array to path.npy and the index to path.json"""
+        path = Path(path)
+        np.save(path.with_suffix(".npy"), np.ascontiguousarray(self.data, dtype=float))
+        with open(path.with_suffix(".json"), "w") as f:
+            json.dump(self.index, f)
+
+    @staticmethod
+    def open(path: Union[str, Path], grid: Tuple[int, int]=None):
+        """Memory-map a database written by PolarDatabase.save"""
+        path = Path(path)
+        with open(path.with_suffix(".json"), "r") as f:
+            index = json.load(f)
+        return PolarDatabase(np.load(path.with_suffix(".npy"), mmap_mode="r"), index, grid)
+
+
+if __name__ == '__main__':
+    import sys
+    src = sys.argv[1] if len(sys.argv) > 1 else "acdesign/data/uiuc"
+    out = sys.argv[2] if len(sys.argv) > 2 else "acdesign/data/uiuc_polars"
+    db = PolarDatabase.pack(src)
+    db.save(out)
+    print(f"packed {len(db)} airfoils, {len(db.data)} rows into {Path(out).with_suffix('.npy')}")
@@ -0,0 +1,118 @@
+import json
+import numpy as np
+import pandas as pd
+from typing import Dict
+from .polar import PolarLookup, UIUCPolars, PolarPoints
+
+
+class PolyCurves:
+    def __init__(self, logre: np.ndarray, coef: np.ndarray):
+        """A polynomial y(x) for each Reynolds number, with the coefficients
+        interpolated linearly in log10(Re) and clamped at the ends.
+
+        Args:
+            logre (np.ndarray): (n,) log10 Reynolds numbers, ascending
+            coef (np.ndarray): (n, deg+1) polynomial coefficients, highest power first
+        """
+        self.logre = np.asarray(logre, dtype=float)
+        self.coef = np.asarray(coef, dtype=float)
+
+    @staticmethod
+    def fit(re: np.ndarray, x: np.ndarray, y: np.ndarray, deg: int):
+        logre, coef = [], []
+        for r in np.unique(re):
+            sel = re == r
+            d = min(deg, sel.sum() - 1)
+            c = np.polyfit(x[sel], y[sel], d)
+            logre.append(np.log10(r))
+            coef.append(np.concatenate([np.zeros(deg - d), c]))
+        return PolyCurves(logre, coef)
+
+    def __call__(self, re, x) -> np.ndarray:
+        re, x = np.broadcast_arrays(np.asarray(re, dtype=float), np.asarray(x, dtype=float))
+        if len(self.logre) == 1:
+            return np.polyval(self.coef[0], x)
+        logre = np.clip(np.log10(re), self.logre[0], self.logre[-1])
+        i = np.clip(np.searchsorted(self.logre, logre) - 1, 0, len(self.logre) - 2)
+        f = (logre - self.logre[i]) / (self.logre[i + 1] - self.logre[i])
+        res = np.zeros(re.shape)
+        for c0, c1 in zip(np.moveaxis(self.coef[i], -1, 0), np.moveaxis(self.coef[i + 1], -1, 0)):
+            res = res * x + c0 + f * (c1 - c0)
+        return res
+
+    def to_dict(self) -> dict:
+        return dict(logre=self.logre.tolist(), coef=self.coef.tolist())
+
+    @staticmethod
+    def from_dict(data: dict):
+        return PolyCurves(data["logre"], data["coef"])
+
+
+class PolarFit(PolarLookup):
+    def __init__(self, alpha: PolyCurves, Cm: PolyCurves, Cd: PolyCurves, stall_table: pd.DataFrame, residuals: pd.DataFrame=None):
+        """Closed form alpha(Cl, Re), Cm(Cl, Re) and Cd(Cl, Re) fitted to the pre-stall
+        data of a UIUCPolars. Has the same evaluate, lookup and stall interface as 
+        UIUCPolars, so it can be given to WingAero in its place.
+        """
+        self.alpha = alpha
+        self.Cm = Cm
+        self.Cd = Cd
+        self.stall_table = stall_table
+        self.residuals = residuals
+
+    @staticmethod
+    def fit(polars: UIUCPolars, deg: Dict[str, int]=None):
+        """Fit polynomials in Cl to each Reynolds number table of some polars.
+
+        Args:
+            polars (UIUCPolars): the polars to fit
+            deg (Dict[str, int], optional): polynomial degree for alpha, Cm and Cd.
+                Defaults to dict(alpha=2, Cm=2, Cd=4).
+        """
+        deg = dict(dict(alpha=2, Cm=2, Cd=4), **(deg or {}))
+        lift = polars.pslift
+        drag = polars.drag.loc[polars.drag.pre_stall==1]
+        data = dict(alpha=lift, Cm=lift, Cd=drag)
+
+        curves = {
+            k: PolyCurves.fit(df.re.to_numpy(), df.Cl.to_numpy(), df[k].to_numpy(), deg[k])
+            for k, df in data.items()
+        }
+
+        residuals = {}
+        for k, df in data.items():
+            err = curves[k](df.re.to_numpy(), df.Cl.to_numpy()) - df[k].to_numpy()
+            err = err[~np.isnan(err)]
+            residuals[k] = dict(n=len(err), max=np.abs(err).max(), rms=np.sqrt(np.mean(err**2)))
+
+        return PolarFit(**curves, stall_table=polars.stall_table, residuals=pd.DataFrame(residuals).T)
+
+    def evaluate(self, re, cl) -> PolarPoints:
+        re, cl = np.broadcast_arrays(np.asarray(re, dtype=float), np.asarray(cl, dtype=float))
+        return PolarPoints(re, self.alpha(re, cl), cl, self.Cm(re, cl), self.Cd(re, cl))
+
+    def to_dict(self) -> dict:
+        return dict(
+            alpha=self.alpha.to_dict(),
+            Cm=self.Cm.to_dict(),
+            Cd=self.Cd.to_dict(),
+            stall_table=self.stall_table.to_dict(orient="list"),
+            residuals=None if self.residuals is None else self.residuals.to_dict(orient="index")
+        )
+
+    @staticmethod
+    def from_dict(data: dict):
+        return PolarFit(
+            *[PolyCurves.from_dict(data[k]) for k in ["alpha", "Cm", "Cd"]],
+            pd.DataFrame(data["stall_table"]),
+            None if data.get("residuals") is None else pd.DataFrame(data["residuals"]).T
+        )
+
+    def dump_json(self, file):
+        with open(file, "w") as f:
+            json.dump(self.to_dict(), f)
+
+    @staticmethod
+    def parse_json(file):
+        with open(file, "r") as f:
+            return PolarFit.from_dict(json.load(f))
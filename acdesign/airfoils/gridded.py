@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+from typing import Tuple
+
+
+class RegularGrid:
+    """A polar quantity resampled onto a regular (log10 Re, x) grid, where x is Cl or alpha.
+
+    Lookups are bilinear and clamped to the edges of the grid, so any number of
+    (Re, x) queries are answered with pure array arithmetic.
+    """
+    def __init__(self, logre: np.ndarray, x: np.ndarray, values: np.ndarray, scatter: Tuple[np.ndarray, np.ndarray]=None, inside: np.ndarray=None):
+        self.logre = logre
+        self.x = x
+        self.values = values
+        self.scatter = scatter
+        self.inside = inside
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.values.shape
+
+    @staticmethod
+    def resample(interp, shape: Tuple[int, int]):
+        """Sample a GridInterpolator onto a regular grid spanning its scatter points.
+
+        Args:
+            interp (GridInterpolator): interpolator over (re, x) scatter points
+            shape (Tuple[int, int]): number of grid points in (log10 Re, x)
+        """
+        pts = interp.tri.points
+        logre = np.linspace(*np.log10([pts[:, 0].min(), pts[:, 0].max()]), shape[0])
+        x = np.linspace(pts[:, 1].min(), pts[:, 1].max(), shape[1])
+        lr, xx = np.meshgrid(logre, x, indexing="ij")
+        tests = np.column_stack([10**lr.ravel(), xx.ravel()])
+        return RegularGrid(
+            logre, x, interp(tests).reshape(shape), (pts, interp.z),
+            interp.covers(tests[:, 0], tests[:, 1]).reshape(shape)
+        )
+
+    @staticmethod
+    def _weights(axis: np.ndarray, v: np.ndarray):
+        if len(axis) == 1:
+            return np.zeros(v.shape, dtype=int), np.zeros(v.shape)
+        u = np.clip((v - axis[0]) / (axis[1] - axis[0]), 0, len(axis) - 1)
+        i = np.minimum(u.astype(int), len(axis) - 2)
+        return i, u - i
+
+    def bilinear(self, re, x) -> np.ndarray:
+        """Interpolate at broadcastable arrays of re and x"""
+        re, x = np.broadcast_arrays(np.asarray(re, dtype=float), np.asarray(x, dtype=float))
+        i, fi = RegularGrid._weights(self.logre, np.log10(re))
+        j, fj = RegularGrid._weights(self.x, x)
+        i1 = np.minimum(i + 1, len(self.logre) - 1)
+        j1 = np.minimum(j + 1, len(self.x) - 1)
+        v = self.values
+        return (1 - fi) * ((1 - fj) * v[i, j] + fj * v[i, j1]) + \
+            fi * ((1 - fj) * v[i1, j] + fj * v[i1, j1])
+
+    def at(self, re, x) -> np.ndarray:
+        return self.bilinear(re, x)
+
+    def covers(self, re, x) -> np.ndarray:
+        """True where re and x are within the grid and every grid point used by the lookup
+        was inside the data it was resampled from"""
+        re, x = np.broadcast_arrays(np.asarray(re, dtype=float), np.asarray(x, dtype=float))
+        logre = np.log10(re)
+        res = (logre >= self.logre[0]) & (logre <= self.logre[-1]) & (x >= self.x[0]) & (x <= self.x[-1])
+        if self.inside is None:
+            return res
+        inside = RegularGrid(self.logre, self.x, self.inside.astype(float)).bilinear(re, x)
+        return res & (inside > 1 - 1e-9)
+
+    def __call__(self, tests):
+        tests = np.atleast_2d(np.asarray(tests, dtype=float))
+        return self.bilinear(tests[:, 0], tests[:, 1])
+
+    def error(self) -> pd.Series:
+        """Interpolation error of the grid against the original scatter points"""
+        pts, z = self.scatter
+        err = np.abs(self(pts) - z)
+        err = err[~np.isnan(err)]
+        return pd.Series(dict(
+            n=len(err),
+            max=err.max(),
+            mean=err.mean(),
+            rms=np.sqrt(np.mean(err**2)),
+        ))
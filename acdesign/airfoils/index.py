@@ -0,0 +1,161 @@
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from scipy.spatial import cKDTree
+from typing import List, Tuple, Union
+from .airfoil_set import AirfoilSet
+from .cache import CoordinateCache, coordinate_cache, cache_dir, atomic_savez, range_mask
+from .selig import read_set
+
+
+def shape_coefficients(x: np.ndarray, y: np.ndarray, deg: int=4) -> np.ndarray:
+    """(n, deg) least squares Legendre coefficients of (n, m) distributions y on x in [0, 1]"""
+    basis = np.polynomial.legendre.legvander(2 * x - 1, deg - 1)
+    return y @ np.linalg.pinv(basis).T
+
+
+def descriptors(afs: AirfoilSet, deg: int=4) -> pd.DataFrame:
+    """Compact shape descriptors for every airfoil in a set: maximum thickness and camber,
+    their locations, the leading edge radius and low order coefficients of the thickness
+    and camber distributions."""
+    tc = shape_coefficients(afs.x, afs.thickness, deg)
+    cc = shape_coefficients(afs.x, afs.camber, deg)
+    return pd.DataFrame(dict(
+        max_thickness=afs.max_thickness,
+        max_thickness_x=afs.max_thickness_x,
+        max_camber=afs.max_camber,
+        max_camber_x=afs.max_camber_x,
+        le_radius=afs.le_radius,
+        **{f"t{i}": tc[:, i] for i in range(deg)},
+        **{f"c{i}": cc[:, i] for i in range(deg)},
+    ), index=pd.Index(afs.names, name="name"))
+
+
+class ShapeIndex:
+    def __init__(self, data: pd.DataFrame):
+        """Nearest neighbour and range queries over airfoil shape descriptors. Distances
+        are taken on the descriptors divided by their standard deviation, using a KD-tree.
+
+        Args:
+            data (pd.DataFrame): descriptors, as returned by descriptors, indexed by name
+        """
+        self.data = data
+        self.scale = data.std().replace(0, 1).fillna(1).to_numpy()
+        self.tree = cKDTree(self.scaled(data.to_numpy()))
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.data.index
+
+    @property
+    def names(self) -> List[str]:
+        return list(self.data.index)
+
+    def scaled(self, values: np.ndarray) -> np.ndarray:
+        return np.asarray(values, dtype=float) / self.scale
+
+    @staticmethod
+    def from_set(afs: AirfoilSet, deg: int=4):
+        return ShapeIndex(descriptors(afs, deg))
+
+    @staticmethod
+    def from_cache(cache: CoordinateCache=coordinate_cache, m: int=101, deg: int=4) -> Tuple["ShapeIndex", dict]:
+        """Index every airfoil in the local coordinate store, returning the index and
+        the errors for files that could not be read."""
+        afs, errors = read_set(
+            ((name, cache.lookup(name).read_text(encoding="latin-1")) for name in cache.names() if cache.lookup(name)),
+            m
+        )
+        return ShapeIndex.from_set(afs, deg), errors
+
+    def save(self, path: Union[str, Path], **source: np.ndarray):
+        """Write the index to an npz file. source arrays describe what it was built from
+        and are stored with it, for open to check."""
+        atomic_savez(
+            path,
+            data=self.data.to_numpy(dtype=float),
+            columns=np.array(self.data.columns, dtype=str),
+            names=np.array(self.data.index, dtype=str),
+            **{f"source_{k}": v for k, v in source.items()},
+        )
+
+    @staticmethod
+    def load(path: Union[str, Path]):
+        with np.load(path, allow_pickle=False) as npz:
+            return ShapeIndex(pd.DataFrame(
+                npz["data"],
+                columns=list(npz["columns"]),
+                index=pd.Index(npz["names"], name="name")
+            ))
+
+    @staticmethod
+    def _source(path: Path) -> dict:
+        with np.load(path, allow_pickle=False) as npz:
+            return {k[7:]: npz[k] for k in npz.files if k.startswith("source_")}
+
+    @staticmethod
+    def open(path: Union[str, Path]=None, cache: CoordinateCache=coordinate_cache, m: int=101, deg: int=4):
+        """Load the index, building it from the coordinate store if it has not been saved
+        or if the airfoils in the store, their contents, m or deg have changed since.
+
+        Args:
+            path (Union[str, Path], optional): index file. Defaults to cache_dir("index", "shapes.npz").
+            cache (CoordinateCache, optional): store to build from. Defaults to coordinate_cache.
+            m (int, optional): points per surface to resample to. Defaults to 101.
+            deg (int, optional): shape coefficients per distribution. Defaults to 4.
+        """
+        path = Path(path) if path else cache_dir("index", "shapes.npz")
+        hashes = cache.hashes()
+        source = dict(
+            names=np.array(list(hashes.keys()), dtype=str),
+            hashes=np.array(list(hashes.values()), dtype=str),
+            m=np.array(m),
+            deg=np.array(deg),
+        )
+        if path.exists():
+            saved = ShapeIndex._source(path)
+            if saved.keys() == source.keys() and all(np.array_equal(saved[k], v) for k, v in source.items()):
+                return ShapeIndex.load(path)
+        index, _ = ShapeIndex.from_cache(cache, m, deg)
+        index.save(path, **source)
+        return index
+
+    def mask(self, **ranges: Tuple[float, float]) -> np.ndarray:
+        """rows with each named descriptor within (lower, upper), None for no bound"""
+        return range_mask(self.data, **ranges)
+
+    def query(self, **ranges: Tuple[float, float]) -> pd.DataFrame:
+        """Descriptors of the airfoils within the given ranges, for example
+        query(max_thickness=(0.1, 0.12), max_camber=(0.035, 0.045))
+        """
+        return self.data.loc[self.mask(**ranges)]
+
+    def nearest(self, target: Union[str, pd.Series], k: int=5, **ranges: Tuple[float, float]) -> pd.DataFrame:
+        """The k airfoils closest in shape to a target, optionally restricted to ranges
+        of the descriptors as in query. The target itself is not returned.
+
+        Args:
+            target (Union[str, pd.Series]): name of an indexed airfoil or its descriptors
+            k (int, optional): number to return. Defaults to 5.
+        """
+        if isinstance(target, str):
+            point = self.scaled(self.data.loc[target].to_numpy())
+        else:
+            point = self.scaled(target[self.data.columns].to_numpy())
+        exclude = target if isinstance(target, str) else None
+
+        if ranges:
+            sel = np.flatnonzero(self.mask(**ranges) & (self.data.index != exclude))
+            dist = np.linalg.norm(self.tree.data[sel] - point, axis=1)
+            order = np.argsort(dist)[:k]
+            idx, dist = sel[order], dist[order]
+        else:
+            n = min(k + (exclude is not None), len(self.data))
+            dist, idx = self.tree.query(point, k=n)
+            dist, idx = np.atleast_1d(dist), np.atleast_1d(idx)
+            keep = self.data.index[idx] != exclude
+            idx, dist = idx[keep][:k], dist[keep][:k]
+
+        return self.data.iloc[idx].assign(distance=dist)
@@ -0,0 +1,99 @@
+import numpy as np
+from collections import OrderedDict
+from threading import Lock
+from .polar import PolarLookup, UIUCPolars, PolarPoints
+
+
+class PolarLookupCache(PolarLookup):
+    def __init__(self, polars: UIUCPolars, maxsize: int=100000, re_tol: float=100.0, cl_tol: float=1e-4):
+        """A bounded LRU cache in front of UIUCPolars.evaluate, keyed on re and Cl rounded
+        to the given tolerances. Misses are looked up at the rounded point, so results
+        do not depend on what is already in the cache. Safe to share between threads.
+
+        Can be used anywhere a UIUCPolars is, for example to memoise the polars used
+        by Performance: PolarRegistry(lambda name: PolarLookupCache(UIUCPolars.local(name)))
+
+        Args:
+            polars (UIUCPolars): the polars to look up
+            maxsize (int, optional): maximum number of cached points. Defaults to 100000.
+            re_tol (float, optional): rounding of the Reynolds number. Defaults to 100.0.
+            cl_tol (float, optional): rounding of Cl. Defaults to 1e-4.
+        """
+        self.polars = polars
+        self.maxsize = maxsize
+        self.re_tol = re_tol
+        self.cl_tol = cl_tol
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._lock = Lock()
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(f"Attribute {name} not found")
+        return getattr(self.polars, name)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def info(self) -> dict:
+        total = self.hits + self.misses
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            hit_rate=self.hits / total if total > 0 else 0.0,
+            size=len(self._cache),
+            maxsize=self.maxsize
+        )
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def evaluate(self, re, cl) -> PolarPoints:
+        re, cl = np.broadcast_arrays(np.asarray(re, dtype=float), np.asarray(cl, dtype=float))
+        qre = np.round(re.ravel() / self.re_tol).astype(np.int64).tolist()
+        qcl = np.round(cl.ravel() / self.cl_tol).astype(np.int64).tolist()
+        keys = list(zip(qre, qcl))
+
+        out = np.empty((len(keys), 3))
+        missing = []
+        with self._lock:
+            for i, key in enumerate(keys):
+                val = self._cache.get(key)
+                if val is None:
+                    missing.append(i)
+                else:
+                    self._cache.move_to_end(key)
+                    out[i] = val
+            self.hits += len(keys) - len(missing)
+            self.misses += len(missing)
+
+        if len(missing) > 0:
+            new_keys = list(OrderedDict.fromkeys(keys[i] for i in missing))
+            qpts = np.array(new_keys, dtype=float)
+            res = self.polars.evaluate(qpts[:, 0] * self.re_tol, qpts[:, 1] * self.cl_tol)
+            vals = dict(zip(new_keys, np.column_stack([res.alpha, res.Cm, res.Cd])))
+            for i in missing:
+                out[i] = vals[keys[i]]
+            with self._lock:
+                self._cache.update(vals)
+                while len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+
+        return PolarPoints(re, out[:, 0].reshape(re.shape), cl, out[:, 1].reshape(re.shape), out[:, 2].reshape(re.shape))
+
+    # alpha_to_cl is forwarded to the polars, and evaluate uses the cache
+    aevaluate = UIUCPolars.aevaluate
+    alookup = UIUCPolars.alookup
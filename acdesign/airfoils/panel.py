@@ -0,0 +1,230 @@
+import numpy as np
+import pandas as pd
+from scipy.linalg import lu_factor, lu_solve
+from scipy.interpolate import CubicSpline
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from collections import namedtuple
+from typing import Dict, List, Tuple
+from .airfoil import Airfoil
+from .airfoil_set import cosine_spacing
+from .polar import UIUCPolars
+
+
+InviscidSolution = namedtuple("InviscidSolution", ["alpha", "gamma", "Cl", "Cm", "Cp"])
+BoundaryLayer = namedtuple("BoundaryLayer", ["Cd", "xtr_top", "xtr_btm", "xsep_top"])
+
+
+def repanel(coords: np.ndarray, n: int=81) -> np.ndarray:
+    """(2n-1, 2) unit chord Selig ordered coordinates, with n nodes on each surface cosine
+    spaced in arc length along a spline through the given coordinates"""
+    coords = np.asarray(coords, dtype=float)
+    ds = np.hypot(*np.diff(coords, axis=0).T)
+    coords = coords[np.concatenate([[True], ds > 0])]
+    s = np.concatenate([[0], np.cumsum(ds[ds > 0])])
+    spline = CubicSpline(s, coords, axis=0)
+
+    s_le = s[np.argmin(coords[:, 0])]
+    spacing = cosine_spacing(n)
+    nodes = spline(np.concatenate([s_le * spacing, s_le + (s[-1] - s_le) * spacing[1:]]))
+
+    le = nodes[n - 1]
+    return (nodes - le) / (nodes[[0, -1], 0].mean() - le[0])
+
+
+class PanelSolver:
+    def __init__(self, coords: np.ndarray):
+        """Linear strength vortex panel method for a unit chord airfoil. The influence
+        matrix is factored once, so any number of angles of attack can be solved
+        together as right hand sides.
+
+        Args:
+            coords (np.ndarray): (n, 2) panel nodes in Selig order, from the trailing edge
+                over the upper surface and back along the lower surface
+        """
+        self.coords = np.asarray(coords, dtype=float)
+        d = np.diff(self.coords, axis=0)
+        self.length = np.hypot(d[:, 0], d[:, 1])
+        self.tangent = d / self.length[:, None]
+        self.normal = np.column_stack([-self.tangent[:, 1], self.tangent[:, 0]])
+        self.mid = 0.5 * (self.coords[1:] + self.coords[:-1])
+        self.lu = lu_factor(self.influence())
+
+    @staticmethod
+    def from_airfoil(airfoil: Airfoil, n: int=81):
+        """Solver for an airfoil repanelled with n cosine spaced stations per surface"""
+        return PanelSolver(repanel(np.column_stack([airfoil.points.x, airfoil.points.y]), n))
+
+    def influence(self) -> np.ndarray:
+        """(n, n) normal velocity at each control point per unit node vorticity, with the
+        Kutta condition as the last row"""
+        rel = self.mid[:, None, :] - self.coords[None, :-1, :]
+        x = np.sum(rel * self.tangent[None, :, :], axis=2)
+        z = np.sum(rel * self.normal[None, :, :], axis=2)
+        L = self.length[None, :]
+
+        r1 = np.hypot(x, z)
+        r2 = np.hypot(x - L, z)
+        beta = np.arctan2(z, x - L) - np.arctan2(z, x)
+        lnr = np.log(r1 / r2)
+
+        # panel frame velocities from a unit constant and a unit linear (0 -> 1) sheet
+        uc, wc = -beta / (2 * np.pi), lnr / (2 * np.pi)
+        ul = -(x * beta - z * lnr) / (2 * np.pi * L)
+        wl = (x * lnr - L + z * beta) / (2 * np.pi * L)
+
+        # normal velocity at the control points, panel axes rotated to control point axes
+        tn = self.normal @ self.tangent.T
+        nn = self.normal @ self.normal.T
+        a = np.zeros((len(self.mid) + 1, len(self.coords)))
+        a[:-1, :-1] += (uc - ul) * tn + (wc - wl) * nn
+        a[:-1, 1:] += ul * tn + wl * nn
+        a[-1, 0] = a[-1, -1] = 1
+        return a
+
+    def solve(self, alpha: np.ndarray) -> InviscidSolution:
+        """Node vorticity, Cl, Cm about the quarter chord and node Cp for an array of
+        angles of attack (degrees), with a freestream velocity of 1."""
+        alpha = np.atleast_1d(np.asarray(alpha, dtype=float))
+        ar = np.radians(alpha)
+        vinf = np.column_stack([np.cos(ar), np.sin(ar)])
+        rhs = np.zeros((len(self.coords), len(alpha)))
+        rhs[:-1] = -self.normal @ vinf.T
+        gamma = lu_solve(self.lu, rhs)
+
+        circulation = np.sum(0.5 * self.length[:, None] * (gamma[:-1] + gamma[1:]), axis=0)
+        cp = 1 - gamma**2
+
+        pcp = 0.5 * (cp[:-1] + cp[1:]) * self.length[:, None]
+        fx = pcp * self.normal[:, 0, None]
+        fy = pcp * self.normal[:, 1, None]
+        cm = -np.sum((self.mid[:, 0, None] - 0.25) * fy - self.mid[:, 1, None] * fx, axis=0)
+
+        return InviscidSolution(alpha, gamma.T, -2 * circulation, cm, cp.T)
+
+    def boundary_layer(self, gamma: np.ndarray, re: float, n_crit: float=1.174) -> BoundaryLayer:
+        """Integral boundary layer drag estimate for one solution. Thwaites' method for
+        the laminar part, Michel's transition criterion (scaled by n_crit), Head's method
+        for the turbulent part and the Squire-Young formula at the trailing edge.
+
+        Args:
+            gamma (np.ndarray): (n,) node vorticity from solve
+            re (float): chord Reynolds number
+            n_crit (float, optional): coefficient of Michel's criterion. Defaults to 1.174.
+        """
+        # the closely spaced trailing edge node values are poorly conditioned, extrapolate from upstream
+        gamma = np.array(gamma)
+        for i in [2, 1, 0]:
+            gamma[i] = 2 * gamma[i + 1] - gamma[i + 2]
+            gamma[-i - 1] = 2 * gamma[-i - 2] - gamma[-i - 3]
+        k = int(np.argmax(gamma > 0))
+        if k == 0:
+            raise ValueError("stagnation point not found")
+        f = gamma[k - 1] / (gamma[k - 1] - gamma[k])
+        stag = self.coords[k - 1] + f * (self.coords[k] - self.coords[k - 1])
+
+        cd, xtr, xsep = 0.0, [], []
+        for nodes in [np.arange(k - 1, -1, -1), np.arange(k, len(self.coords))]:
+            nodes = nodes[np.any(self.coords[nodes] != stag, axis=1)]
+            pts = np.vstack([stag, self.coords[nodes]])
+            s = np.concatenate([[0], np.cumsum(np.hypot(*np.diff(pts, axis=0).T))])
+            ue = np.abs(np.concatenate([[0], gamma[nodes]]))
+            theta, H, x_tr, x_sep = PanelSolver._march(s, ue, pts[:, 0], re, n_crit)
+            cd += 2 * theta * ue[-1]**((H + 5) / 2)
+            xtr.append(x_tr)
+            xsep.append(x_sep)
+        return BoundaryLayer(cd, xtr[0], xtr[1], xsep[0])
+
+    @staticmethod
+    def _march(s, ue, x, re, n_crit, h_sep: float=2.4):
+        """momentum thickness and shape factor at the end of one surface, transition
+        and separation x locations (1 if there is none)"""
+        ue = np.maximum(ue, 1e-6)
+        due = np.gradient(ue, s)
+        integral = np.concatenate([[0], np.cumsum(0.5 * (ue[1:]**5 + ue[:-1]**5) * np.diff(s))])
+        theta2 = 0.45 * integral / (re * ue**6)
+        theta2[0] = 0.075 / (re * max(abs(due[1]), 1e-6))
+        lam = np.clip(theta2 * re * due, -0.09, 0.1)
+        H = np.where(lam >= 0, 2.61 - 3.75 * lam + 5.24 * lam**2, 2.088 + 0.0731 / (lam + 0.14))
+
+        re_x = re * ue * s
+        re_theta = re * ue * np.sqrt(theta2)
+        trans = (re_theta > n_crit * (1 + 22400 / np.maximum(re_x, 1)) * re_x**0.46) | (theta2 * re * due <= -0.09)
+        trans[0] = False
+        if not np.any(trans):
+            return np.sqrt(theta2[-1]), H[-1], 1.0, 1.0
+        i = int(np.argmax(trans))
+
+        theta, h, x_sep = np.sqrt(theta2[i]), 1.4, 1.0
+        h1 = 3.3 + 0.8234 * (h - 1.1)**-1.287
+        for j in range(i, len(s) - 1):
+            ds = s[j + 1] - s[j]
+            cf = 0.246 * 10**(-0.678 * h) * (re * ue[j] * theta)**-0.268
+            dtheta = cf / 2 - (h + 2) * theta / ue[j] * due[j]
+            f = 0.0306 * max(h1 - 3, 1e-3)**-0.6169
+            uth1 = ue[j] * theta * h1 + ue[j] * f * ds
+            theta = max(theta + dtheta * ds, 1e-9)
+            h1 = max(uth1 / (ue[j + 1] * theta), 3.32)
+            h = 0.6778 + 1.1536 * (h1 - 3.3)**-0.326 if h1 < 5.3 else 1.1 + 0.86 * (h1 - 3.3)**-0.777
+            if h > h_sep:
+                x_sep = min(x_sep, x[j + 1])
+                h = h_sep
+        return theta, h, x[i], x_sep
+
+    def polars(self, re: List[float], alpha: np.ndarray, xsep_stall: float=0.9) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Lift and drag tables in the shape read by LFTDRGParser. Lift is inviscid, so
+        each table stops at the last angle of attack before the upper surface boundary
+        layer separates ahead of xsep_stall, which gives an estimate of Clmax.
+        """
+        sol = self.solve(alpha)
+        tables = []
+        for r in np.atleast_1d(re):
+            bls = [self.boundary_layer(g, r) for g in sol.gamma]
+            attached = np.array([bl.xsep_top >= xsep_stall for bl in bls])
+            keep = np.cumprod(attached | (sol.alpha <= 0)).astype(bool)
+            tables.append(pd.DataFrame(dict(
+                alpha=sol.alpha,
+                Cl=sol.Cl,
+                Cm=sol.Cm,
+                Cd=[bl.Cd for bl in bls],
+                re=float(r),
+                pre_stall=1.0,
+            )).loc[keep])
+        df = pd.concat(tables, ignore_index=True)
+        return df.loc[:, ["alpha", "Cl", "Cm", "re", "pre_stall"]], df.loc[:, ["alpha", "Cl", "Cd", "re", "pre_stall"]]
+
+
+def panel_polars(airfoil: Airfoil, re: List[float], alpha: np.ndarray=np.arange(-6, 14.1, 1.0), n: int=81, grid: Tuple[int, int]=None) -> UIUCPolars:
+    """UIUCPolars generated by the panel method, for airfoils that have no UIUC wind tunnel data.
+    For example PolarRegistry(lambda name: panel_polars(Airfoil.download(name), [1e5, 3e5, 1e6])).
+
+    Args:
+        airfoil (Airfoil): the section
+        re (List[float]): Reynolds numbers to tabulate, at least two
+        alpha (np.ndarray, optional): angles of attack, degrees. Defaults to -6 to 14.
+        n (int, optional): stations per surface. Defaults to 81.
+        grid (Tuple[int, int], optional): see UIUCPolars. Defaults to None.
+    """
+    return UIUCPolars(*PanelSolver.from_airfoil(airfoil, n).polars(re, alpha), grid)
+
+
+def _polar_tables(args):
+    airfoil, re, alpha, n = args
+    try:
+        return airfoil.name, PanelSolver.from_airfoil(airfoil, n).polars(re, alpha), None
+    except Exception as ex:
+        return airfoil.name, None, f"{type(ex).__name__}: {ex}"
+
+
+def panel_polars_many(airfoils: List[Airfoil], re: List[float], alpha: np.ndarray=np.arange(-6, 14.1, 1.0), n: int=81,
+                      processes: bool=True, max_workers: int=None, grid: Tuple[int, int]=None) -> Tuple[Dict[str, UIUCPolars], Dict[str, str]]:
+    """Run panel_polars for many airfoils in a process (or thread) pool, returning the
+    polars by airfoil name and the errors for any that failed."""
+    pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    polars, errors = {}, {}
+    with pool(max_workers) as executor:
+        for name, tables, error in executor.map(_polar_tables, [(af, re, alpha, n) for af in airfoils]):
+            if error is None:
+                polars[name] = UIUCPolars(*tables, grid)
+            else:
+                errors[name] = error
+    return polars, errors
@@ -1,18 +1,78 @@
 import numpy as np 
 import pandas as pd
 from io import TextIOWrapper
-from scipy.interpolate import interp2d, griddata
+from scipy.interpolate import LinearNDInterpolator
+from scipy.spatial import Delaunay, cKDTree
 from numbers import Number
-from typing import Union
+from abc import ABC, abstractmethod
+from typing import Union, Tuple, List
+from collections import namedtuple
 import urllib.request
 from urllib.error import HTTPError
-from bs4 import BeautifulSoup
+from pkg_resources import resource_filename
+from .gridded import RegularGrid
+from .cache import PolarCache, polar_cache
 
 
 class LFTDRGParser:
     def __init__(self, f: TextIOWrapper):
         self.f = f
 
+    @staticmethod
+    def parse_file(file) -> pd.DataFrame:
+        with open(file, "r") as f:
+            return LFTDRGParser.parse_text(f.read())
+
+    @staticmethod
+    def parse_files(files: List[str], processes: bool=False, max_workers: int=None) -> List[pd.DataFrame]:
+        """Parse many polar files in a thread (or process) pool, returned in the order given"""
+        from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+        pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        with pool(max_workers) as executor:
+            return list(executor.map(LFTDRGParser.parse_file, files))
+
+    @staticmethod
+    def parse_text(text: str) -> pd.DataFrame:
+        """Fast equivalent of read_all. Locates each Reynolds number table in the 
+        text and converts its numeric block with a single numpy call.
+        """
+        key = "Average Reynolds #:"
+        blocks, headings = [], None
+        lines = text.split("\n")
+        for start in [i for i, line in enumerate(lines) if key in line]:
+            re = float(lines[start + 1])
+            assert "Number of angles of attack:" in lines[start + 2]
+            n = int(lines[start + 3])
+            _headings = [h.strip() for h in lines[start + 4].strip().split('/')]
+
+            data = np.array(" ".join(lines[start + 5:start + 5 + n]).split(), dtype=float)
+            data = data.reshape(n, len(data) // n)
+
+            if ">>>" in _headings[-1]:
+                _headings = _headings[:-1] + [f"scd{i}" for i in range(data.shape[1] - 3)]
+            if headings is None:
+                headings = _headings
+            assert _headings == headings, "inconsistent table headings"
+
+            blocks.append(np.column_stack([
+                data, 
+                np.full(n, re), 
+                LFTDRGParser._pre_stall(data[:, headings.index("Cl")])
+            ]))
+
+        return pd.DataFrame(
+            np.concatenate(blocks), 
+            columns=headings + ["re", "pre_stall"],
+            index=np.concatenate([np.arange(len(b)) for b in blocks])
+        )
+
+    @staticmethod
+    def _pre_stall(cl: np.ndarray) -> np.ndarray:
+        """1 up to the first drop in Cl, -1 after it"""
+        direc = np.sign(np.gradient(cl)) if len(cl) > 1 else np.ones(1)
+        ist = len(cl) if np.all(direc>=0) else np.argmax(direc < 0)
+        return np.concatenate([np.ones(ist), -np.ones(len(cl)-ist) ])
+
     def read_all(self) -> pd.DataFrame:
         res = []
         while True:
@@ -44,86 +104,197 @@ class LFTDRGParser:
 
         df = pd.DataFrame(rows, columns = headings).astype("float").assign(re=re)
 
-        direc = np.sign(np.gradient(df.Cl)) if len(df) > 1 else np.ones(1)
-        ist = len(df) if np.all(direc==1) else df.loc[direc < 0].iloc[0].name
-        arr = np.concatenate([np.ones(ist), -np.ones(len(df)-ist) ])
-        return df.assign(pre_stall=arr)
+        return df.assign(pre_stall=LFTDRGParser._pre_stall(df.Cl.to_numpy()))
 
 
-def interpgrid(x,y,z, method="linear"):
-    def _interp(tests):
-        res = griddata(
-            np.column_stack([x,y]), 
-            z.to_numpy(), 
-            tests,
-            method
-        )
+class Triangulation:
+    """Delaunay triangulation and nearest neighbour tree of a set of scattered
+    (x, y) points. Built once and shared by every interpolator over those points.
+    """
+    def __init__(self, x, y):
+        self.points = np.column_stack([x, y]).astype(float)
+        self.delaunay = Delaunay(self.points)
+        self.tree = cKDTree(self.points)
+
+    def interpolator(self, z):
+        return GridInterpolator(self, z)
+
+
+class GridInterpolator:
+    """Linear interpolation over a Triangulation, falling back to the nearest
+    data point outside the convex hull (equivalent to the old griddata calls).
+    """
+    def __init__(self, tri: Triangulation, z):
+        self.tri = tri
+        self.z = np.asarray(z, dtype=float)
+        self.linear = LinearNDInterpolator(tri.delaunay, self.z)
+
+    def __call__(self, tests):
+        tests = np.atleast_2d(np.asarray(tests, dtype=float))
+        res = self.linear(tests)
         nans = np.isnan(res)
         if np.any(nans):
-
-            resnan = griddata(
-                np.column_stack([x,y]), 
-                z.to_numpy(), 
-                tests,
-                method="nearest",
-            )
-            res[nans] = resnan[nans]
+            res[nans] = self.z[self.tri.tree.query(tests[nans])[1]]
         return res
 
-    return _interp
+    def at(self, re, x) -> np.ndarray:
+        """Interpolate at broadcastable arrays of re and x"""
+        re, x = np.broadcast_arrays(np.asarray(re, dtype=float), np.asarray(x, dtype=float))
+        return self(np.column_stack([re.ravel(), x.ravel()])).reshape(re.shape)
+
+    def covers(self, re, x) -> np.ndarray:
+        """True where re and x are inside the convex hull of the data, so not extrapolated"""
+        re, x = np.broadcast_arrays(np.asarray(re, dtype=float), np.asarray(x, dtype=float))
+        return (self.tri.delaunay.find_simplex(np.column_stack([re.ravel(), x.ravel()])) >= 0).reshape(re.shape)
+
+
+def interpgrid(x, y, z):
+    return Triangulation(x, y).interpolator(z)
 
 
-class UIUCPolars:
-    def __init__(self, lift: pd.DataFrame, drag: pd.DataFrame):
+PolarPoints = namedtuple("PolarPoints", ["re", "alpha", "Cl", "Cm", "Cd"])
+
+
+class PolarLookup(ABC):
+    """Lookups shared by the polar models. Subclasses provide evaluate(re, cl) and a
+    stall_table with the re, Clmax and alpha_stall of each Reynolds number table."""
+
+    @abstractmethod
+    def evaluate(self, re, cl) -> PolarPoints:
+        """Polar points at each re and cl"""
+
+    def apply(self, recl: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(
+            np.column_stack(self.evaluate(recl[:,0], recl[:,1])),
+            columns=PolarPoints._fields
+        )
+
+    @staticmethod
+    def _product(re:Union[list, Number], x:Union[list, Number]) -> Tuple[np.ndarray, np.ndarray]:
+        x, re = np.meshgrid(np.atleast_1d(x), np.atleast_1d(re), indexing="ij")
+        return re.ravel(), x.ravel()
+
+    def lookup(self, re:Union[list, Number], cl:Union[list, Number]) -> pd.DataFrame:
+        return self.apply(np.column_stack(PolarLookup._product(re, cl)))
+
+    def _stall_interp(self, re, col: str) -> np.ndarray:
+        return np.interp(
+            np.log10(np.asarray(re, dtype=float)), 
+            np.log10(self.stall_table.re.to_numpy()), 
+            self.stall_table[col].to_numpy()
+        )
+
+    def clmax(self, re) -> np.ndarray:
+        """section Clmax, interpolated in log Re and clamped to the range of the data"""
+        return self._stall_interp(re, "Clmax")
+
+    def alpha_stall(self, re) -> np.ndarray:
+        """angle of attack at Clmax, interpolated in log Re"""
+        return self._stall_interp(re, "alpha_stall")
+
+    def stalled(self, re, cl) -> np.ndarray:
+        return np.asarray(cl) > self.clmax(re)
+
+
+class UIUCPolars(PolarLookup):
+    interpolators = ["alpha_to_cl", "cl_to_alpha", "cl_to_cm", "cl_to_cd"]
+
+    def __init__(self, lift: pd.DataFrame, drag: pd.DataFrame, grid: Tuple[int, int]=None):
+        """Interpolated lift and drag polars for an airfoil.
+
+        Args:
+            lift (pd.DataFrame): lift tables, as read by LFTDRGParser
+            drag (pd.DataFrame): drag tables, as read by LFTDRGParser
+            grid (Tuple[int, int], optional): if given, resample each polar onto a 
+                regular (log Re, Cl or alpha) grid of this shape and use bilinear 
+                lookups instead of the scattered interpolation. Defaults to None.
+        """
         self.lift = lift
         self.drag = drag
+        self.grid = grid
 
         self.pslift = self.lift.loc[self.lift.pre_stall==1]
     
         self.alpha_to_cl = interpgrid(self.pslift.re, self.pslift.alpha, self.pslift.Cl)
 
-        self.cl_to_alpha = interpgrid(self.pslift.re, self.pslift.Cl, self.pslift.alpha)
-        self.cl_to_cm = interpgrid(self.pslift.re, self.pslift.Cl, self.pslift.Cm)
+        lift_tri = Triangulation(self.pslift.re, self.pslift.Cl)
+        self.cl_to_alpha = lift_tri.interpolator(self.pslift.alpha)
+        self.cl_to_cm = lift_tri.interpolator(self.pslift.Cm)
         self.cl_to_cd = interpgrid(self.drag.re, self.drag.Cl, self.drag.Cd)
-    
 
-    def apply(self, recl: np.ndarray) -> pd.DataFrame:
-        return pd.DataFrame(
-            np.column_stack([
-                recl[:,0],
-                self.cl_to_alpha(recl),
-                recl[:,1],
-                self.cl_to_cm(recl),
-                self.cl_to_cd(recl)
-            ]),
-            columns=["re", "alpha", "Cl", "Cm", "Cd"]
+        if grid is not None:
+            for name in UIUCPolars.interpolators:
+                setattr(self, name, RegularGrid.resample(getattr(self, name), grid))
+
+        self.stall_table = UIUCPolars._stall_table(self.lift)
+
+    @staticmethod
+    def _stall_table(lift: pd.DataFrame) -> pd.DataFrame:
+        """Clmax and the alpha at which it occurs for each Reynolds number table"""
+        imax = lift.reset_index(drop=True).groupby("re").Cl.idxmax()
+        return pd.DataFrame(dict(
+            re=imax.index.to_numpy(),
+            Clmax=lift.Cl.to_numpy()[imax],
+            alpha_stall=lift.alpha.to_numpy()[imax],
+        ))
+
+    def grid_error(self) -> pd.DataFrame:
+        """Error of the resampled grids against the original scatter points"""
+        assert self.grid is not None, "polars have not been resampled onto a grid"
+        return pd.DataFrame({name: getattr(self, name).error() for name in UIUCPolars.interpolators}).T
+
+    def evaluate(self, re, cl) -> PolarPoints:
+        """Look up broadcastable arrays of re and Cl, returning a tuple of arrays"""
+        re, cl = np.broadcast_arrays(np.asarray(re, dtype=float), np.asarray(cl, dtype=float))
+        return PolarPoints(
+            re, 
+            self.cl_to_alpha.at(re, cl), 
+            cl, 
+            self.cl_to_cm.at(re, cl), 
+            self.cl_to_cd.at(re, cl)
         )
 
-    def lookup(self, re:Union[list, Number], cl:Union[list, Number]) -> pd.DataFrame:
-        re = [re] if isinstance(re, Number) else re
-        cl = [cl] if isinstance(cl, Number) else cl        
-        return self.apply(np.array([[r, c] for c in cl for r in re]))
+    def aevaluate(self, re, alpha) -> PolarPoints:
+        """Look up broadcastable arrays of re and alpha, returning a tuple of arrays.
+        Cl is interpolated from alpha and used to look up Cm and Cd, the alpha returned
+        is the one given."""
+        re, alpha = np.broadcast_arrays(np.asarray(re, dtype=float), np.asarray(alpha, dtype=float))
+        return self.evaluate(re, self.alpha_to_cl.at(re, alpha))._replace(alpha=alpha)
 
     def alookup(self, re: Union[list, Number], alpha:Union[list, Number]) -> pd.DataFrame:
-        return self.lookup(re, self.alpha_to_cl(re, alpha))
+        return pd.DataFrame(
+            np.column_stack(self.aevaluate(*PolarLookup._product(re, alpha))),
+            columns=PolarPoints._fields
+        )
         
     @staticmethod
-    def from_files(lft, drg):
-        with open(lft, "r") as f:
-            lftp = LFTDRGParser(f)
-            lft = lftp.read_all()
-        with open(drg, "r") as f:
-            lftp = LFTDRGParser(f)
-            drg = lftp.read_all()
-        return UIUCPolars(lft, drg)
+    def from_files(lft, drg, grid: Tuple[int, int]=None, cache: PolarCache=polar_cache):
+        """Read polars from a pair of UIUC LFT and DRG files.
+
+        Args:
+            lft: lift file
+            drg: drag file
+            grid (Tuple[int, int], optional): see UIUCPolars. Defaults to None.
+            cache (PolarCache, optional): binary cache of the parsed files, None 
+                to always parse the text. Defaults to polar_cache.
+        """
+        def read(file):
+            if cache is None:
+                return LFTDRGParser.parse_file(file)
+            return cache.read(file, LFTDRGParser.parse_file)
+        return UIUCPolars(read(lft), read(drg), grid)
+
+    @staticmethod
+    def download(airfoil_name: str, grid: Tuple[int, int]=None):
+        return UIUCPolars.from_files(*UIUCPolars._get_uiuc_files(airfoil_name), grid)
 
     @staticmethod
-    def download(airfoil_name: str):
-        return UIUCPolars.from_files(*UIUCPolars._get_uiuc_files(airfoil_name))
+    def local(airfoil_name: str, grid: Tuple[int, int]=None, cache: PolarCache=polar_cache):
+        return UIUCPolars.from_files(*UIUCPolars._get_local_files(airfoil_name), grid, cache)
 
     @staticmethod
-    def local(airfoil_name: str):
-        return UIUCPolars.from_files(*[f"acdesign/data/uiuc/{airfoil_name}.{ld}" for ld in ["LFT", "DRG"]])
+    def _get_local_files(airfoil_name):
+        return [resource_filename("acdesign", f"data/uiuc/{airfoil_name}.{ld}") for ld in ["LFT", "DRG"]]
 
     @staticmethod
     def _get_uiuc_files(airfoil_name):
@@ -138,6 +309,7 @@ class UIUCPolars:
 
 
 def _list_uiucurl(vol):
+    from bs4 import BeautifulSoup
     resp = urllib.request.urlopen(f"https://m-selig.ae.illinois.edu/pd/pub/lsat/vol{vol}/")
     soup = BeautifulSoup(resp, features="html.parser")
     def isaf(file):
@@ -153,6 +325,7 @@ def uiuc_airfoils():
 
 
 def list_url_files(url, extension):
+    from bs4 import BeautifulSoup
     resp = urllib.request.urlopen(url)
     soup = BeautifulSoup(resp, features="html.parser")
     def isaf(file):
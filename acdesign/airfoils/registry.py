@@ -0,0 +1,40 @@
+from threading import Lock
+from typing import Callable, Dict, List
+from .polar import UIUCPolars
+
+
+class PolarRegistry:
+    def __init__(self, loader: Callable[[str], UIUCPolars]=UIUCPolars.local):
+        """Polars by airfoil name, loaded on first access and then held for the
+        life of the process.
+
+        Args:
+            loader (Callable[[str], UIUCPolars], optional): creates the polars for a
+                name. Defaults to UIUCPolars.local, which reads the package data.
+        """
+        self.loader = loader
+        self._polars: Dict[str, UIUCPolars] = {}
+        self._lock = Lock()
+
+    def __getitem__(self, name: str) -> UIUCPolars:
+        try:
+            return self._polars[name]
+        except KeyError:
+            with self._lock:
+                if name not in self._polars:
+                    self._polars[name] = self.loader(name)
+                return self._polars[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._polars
+
+    @property
+    def loaded(self) -> List[str]:
+        return list(self._polars.keys())
+
+    def clear(self):
+        with self._lock:
+            self._polars = {}
+
+
+polars = PolarRegistry()
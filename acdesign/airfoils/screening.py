@@ -0,0 +1,197 @@
+import inspect
+import hashlib
+import warnings
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+from pkg_resources import resource_filename
+from .polar import UIUCPolars
+from .database import PolarDatabase
+from .gridded import RegularGrid
+from .cache import cache_dir, atomic_savez, file_hash
+
+
+class PolarTensor:
+    quantities = ["alpha", "Cm", "Cd"]
+
+    def __init__(self, names: List[str], logre: np.ndarray, cl: np.ndarray, values: np.ndarray, clmax: np.ndarray, errors: Dict[str, str]=None):
+        """Polars for many airfoils sampled on one regular (log10 Re, Cl) grid, so that
+        every airfoil can be looked up in a single array operation. Grid points outside
+        the pre-stall data of an airfoil are nan.
+
+        Args:
+            names (List[str]): airfoil names
+            logre (np.ndarray): (r,) log10 Reynolds numbers, evenly spaced
+            cl (np.ndarray): (c,) lift coefficients, evenly spaced
+            values (np.ndarray): (3, n, r, c) alpha, Cm and Cd for each airfoil
+            clmax (np.ndarray): (n, r) section Clmax at each Reynolds number
+            errors (Dict[str, str], optional): name: error for airfoils that could not be
+                sampled. Defaults to None, no errors.
+        """
+        self.names = list(names)
+        self.logre = logre
+        self.cl = cl
+        self.values = values
+        self.clmax = clmax
+        self.errors = {} if errors is None else errors
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @staticmethod
+    def _sample(polars: UIUCPolars, re: np.ndarray, cl: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        rr, cc = np.meshgrid(re, cl, indexing="ij")
+        res = polars.evaluate(rr, cc)
+        inside = polars.cl_to_alpha.covers(rr, cc) & polars.cl_to_cd.covers(rr, cc)
+        values = np.stack([np.where(inside, getattr(res, q), np.nan) for q in PolarTensor.quantities])
+        return values, polars.clmax(re)
+
+    @staticmethod
+    def from_polars(polars: Dict[str, UIUCPolars], re: Tuple[float, float]=(4e4, 5e5), cl: Tuple[float, float]=(-0.5, 1.8), shape: Tuple[int, int]=(16, 47)):
+        """Sample UIUCPolars onto a common grid. Airfoils that fail are left out and
+        reported in the errors of the tensor.
+
+        Args:
+            polars (Dict[str, UIUCPolars]): name: polars, or a PolarDatabase
+            re (Tuple[float, float], optional): Reynolds number range. Defaults to (4e4, 5e5).
+            cl (Tuple[float, float], optional): Cl range. Defaults to (-0.5, 1.8).
+            shape (Tuple[int, int], optional): grid points in (log10 Re, Cl). Defaults to (16, 47).
+        """
+        logre = np.linspace(*np.log10(re), shape[0])
+        cls = np.linspace(*cl, shape[1])
+        names, values, clmax, errors = [], [], [], {}
+        for name in polars.names if isinstance(polars, PolarDatabase) else list(polars.keys()):
+            try:
+                v, c = PolarTensor._sample(polars[name], 10**logre, cls)
+            except Exception as ex:
+                errors[name] = f"{type(ex).__name__}: {ex}"
+                continue
+            names.append(name)
+            values.append(v)
+            clmax.append(c)
+        if len(names) == 0:
+            raise ValueError(f"none of the {len(errors)} airfoils could be sampled")
+        return PolarTensor(names, logre, cls, np.stack(values, axis=1), np.array(clmax), errors)
+
+    @staticmethod
+    def from_directory(directory: Union[str, Path]=None, **kwargs):
+        """Sample every LFT/DRG pair in a directory, by default the packaged UIUC data.
+        kwargs are passed to from_polars."""
+        return PolarTensor.from_polars(
+            PolarDatabase.pack(directory or resource_filename("acdesign", "data/uiuc")), **kwargs
+        )
+
+    @staticmethod
+    def source_key(directory: Union[str, Path]=None, **kwargs) -> str:
+        """Hash of the LFT/DRG files in a directory and the from_polars grid arguments,
+        with their defaults filled in, that identifies the tensor from_directory would build."""
+        directory = Path(directory or resource_filename("acdesign", "data/uiuc"))
+        grid = inspect.signature(PolarTensor.from_polars).bind(None, **kwargs)
+        grid.apply_defaults()
+        h = hashlib.sha1(repr([(k, tuple(v)) for k, v in grid.arguments.items() if k != "polars"]).encode())
+        for file in sorted(directory.glob("*.LFT")) + sorted(directory.glob("*.DRG")):
+            h.update(f"{file.name}:{file_hash(file)}".encode())
+        return h.hexdigest()
+
+    def save(self, path: Union[str, Path], key: str=""):
+        """Write the tensor to an npz file, with the source_key it was built from"""
+        atomic_savez(
+            path, names=np.array(self.names, dtype=str), logre=self.logre,
+            cl=self.cl, values=self.values, clmax=self.clmax,
+            error_names=np.array(list(self.errors.keys()), dtype=str),
+            error_messages=np.array(list(self.errors.values()), dtype=str),
+            key=np.array(key),
+        )
+
+    @staticmethod
+    def load(path: Union[str, Path]):
+        with np.load(path, allow_pickle=False) as npz:
+            return PolarTensor(
+                list(npz["names"]), npz["logre"], npz["cl"], npz["values"], npz["clmax"],
+                dict(zip(npz["error_names"], npz["error_messages"])) if "error_names" in npz.files else {}
+            )
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        with np.load(path, allow_pickle=False) as npz:
+            return str(npz["key"]) if "key" in npz.files else ""
+
+    @staticmethod
+    def open(path: Union[str, Path]=None, directory: Union[str, Path]=None, **kwargs):
+        """Load the tensor of a directory of polars, by default the packaged UIUC data,
+        sampling and saving it when there is no saved tensor for the current files and grid.
+
+        Args:
+            path (Union[str, Path], optional): Defaults to cache_dir("screening", "uiuc.<source_key>.npz").
+            directory (Union[str, Path], optional): LFT/DRG files. Defaults to the packaged UIUC data.
+            kwargs: grid arguments passed to from_polars
+        """
+        key = PolarTensor.source_key(directory, **kwargs)
+        path = Path(path) if path else cache_dir("screening", f"uiuc.{key}.npz")
+        if path.exists() and PolarTensor._key(path) == key:
+            return PolarTensor.load(path)
+        tensor = PolarTensor.from_directory(directory, **kwargs)
+        try:
+            tensor.save(path, key)
+        except OSError:
+            pass
+        return tensor
+
+    def lookup(self, re, cl) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """alpha, Cm, Cd and Clmax of every airfoil at arrays of re and Cl, each (n airfoils, n points).
+        Bilinear weights are shared by all airfoils, nan where any corner is outside the data."""
+        re, cl = np.broadcast_arrays(np.asarray(re, dtype=float).ravel(), np.asarray(cl, dtype=float).ravel())
+        i, fi = RegularGrid._weights(self.logre, np.log10(re))
+        j, fj = RegularGrid._weights(self.cl, cl)
+        i1 = np.minimum(i + 1, len(self.logre) - 1)
+        j1 = np.minimum(j + 1, len(self.cl) - 1)
+        v = self.values
+        res = (1 - fi) * ((1 - fj) * v[:, :, i, j] + fj * v[:, :, i, j1]) + \
+            fi * ((1 - fj) * v[:, :, i1, j] + fj * v[:, :, i1, j1])
+        clmax = (1 - fi) * self.clmax[:, i] + fi * self.clmax[:, i1]
+        return res[0], res[1], res[2], clmax
+
+
+def screen(tensor: PolarTensor, re, cl, weight=None, rank: str="Cd") -> pd.DataFrame:
+    """Score every airfoil in a PolarTensor against a mission, a set of (re, Cl, weight)
+    operating points, returning a table ranked best first.
+
+    Metrics are the weighted mean Cd, Cl/Cd and Cl^1.5/Cd, the range of Cm over the points,
+    the smallest margin to Clmax and the weighted fraction of the points covered by data.
+    Airfoils without full coverage are ranked after those with it.
+
+    Args:
+        tensor (PolarTensor): the polars to screen
+        re (array like): Reynolds number of each point
+        cl (array like): Cl of each point
+        weight (array like, optional): weight of each point. Defaults to equal weights.
+        rank (str, optional): metric to rank on, Cd, Cm_range are ranked ascending,
+            others descending. Defaults to "Cd".
+    """
+    re, cl = np.broadcast_arrays(np.asarray(re, dtype=float).ravel(), np.asarray(cl, dtype=float).ravel())
+    w = np.ones(len(re)) if weight is None else np.broadcast_to(np.asarray(weight, dtype=float).ravel(), re.shape)
+    w = w / w.sum()
+
+    alpha, cm, cd, clmax = tensor.lookup(re, cl)
+    valid = ~(np.isnan(cd) | np.isnan(cm))
+    coverage = np.sum(valid * w, axis=1)
+
+    def wmean(v):
+        return np.nansum(np.where(valid, v, np.nan) * w, axis=1) / coverage
+
+    with warnings.catch_warnings(), np.errstate(invalid="ignore", divide="ignore"):
+        warnings.simplefilter("ignore", RuntimeWarning)
+        table = pd.DataFrame(dict(
+            Cd=wmean(cd),
+            ClCd=wmean(cl / cd),
+            Cl15Cd=wmean(np.abs(cl)**1.5 * np.sign(cl) / cd),
+            Cm=wmean(cm),
+            Cm_range=np.nanmax(np.where(valid, cm, np.nan), axis=1) - np.nanmin(np.where(valid, cm, np.nan), axis=1),
+            stall_margin=np.min(clmax - cl, axis=1),
+            coverage=coverage,
+        ), index=pd.Index(tensor.names, name="airfoil"))
+
+    ascending = rank in ["Cd", "Cm_range"]
+    table["complete"] = np.isclose(coverage, 1)
+    return table.sort_values(["complete", rank], ascending=[False, ascending]).drop(columns="complete")
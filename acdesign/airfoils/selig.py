@@ -0,0 +1,96 @@
+import zipfile
+import numpy as np
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, Tuple, Union
+from geometry import Point
+from .airfoil import Airfoil, selig_coords
+from .airfoil_set import AirfoilSet, cosine_spacing
+
+
+def iter_sources(source: Union[str, Path, Iterable[Tuple[str, str]]], pattern: str="*.dat") -> Iterator[Tuple[str, str]]:
+    """(key, text) for each coordinate file in a directory or zip archive. 
+    The key is the file name without its suffix. Anything else is assumed to 
+    already be an iterable of (key, text).
+    """
+    if not isinstance(source, (str, Path)):
+        yield from source
+        return
+    source = Path(source)
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as zf:
+            for info in sorted(zf.infolist(), key=lambda i: i.filename):
+                path = Path(info.filename)
+                if not info.is_dir() and path.match(pattern):
+                    yield path.stem, zf.read(info).decode("latin-1")
+    else:
+        for file in sorted(source.glob(pattern)):
+            yield file.stem, file.read_text(encoding="latin-1")
+
+
+def _parse(item: Tuple[str, str]):
+    key, text = item
+    try:
+        name, data = selig_coords(text)
+        if len(data) < 3:
+            raise ValueError(f"only {len(data)} points")
+        return key, name, data, None
+    except Exception as ex:
+        return key, None, None, f"{type(ex).__name__}: {ex}"
+
+
+def read_coords(source: Union[str, Path, Iterable[Tuple[str, str]]], pattern: str="*.dat", processes: bool=False, max_workers: int=None, chunksize: int=64):
+    """Parse every coordinate file in a directory or zip archive in a thread (or process) pool. 
+    Malformed files are reported rather than raised.
+
+    Args:
+        source (Union[str, Path, Iterable[Tuple[str, str]]]): directory or .zip archive of 
+            Selig or Lednicer format files, or (key, text) pairs
+        pattern (str, optional): glob for the files to read. Defaults to "*.dat".
+        processes (bool, optional): use a process pool. Defaults to False.
+        max_workers (int, optional): pool size. Defaults to the executor default.
+        chunksize (int, optional): files per task when using processes. Defaults to 64.
+
+    Returns:
+        Tuple[Dict[str, Tuple[str, np.ndarray]], Dict[str, str]]: key: (name, (n, 2) coordinates)
+            for the files that were read, key: error for those that were not
+    """
+    pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    coords, errors = {}, {}
+    with pool(max_workers) as executor:
+        for key, name, data, error in executor.map(_parse, iter_sources(source, pattern), chunksize=chunksize):
+            if error is None:
+                coords[key] = (name, data)
+            else:
+                errors[key] = error
+    return coords, errors
+
+
+def read_airfoils(source: Union[str, Path], **kwargs) -> Tuple[Dict[str, Airfoil], Dict[str, str]]:
+    """Airfoils for every readable file in a directory or zip archive, keyed on file name, 
+    and the errors for those that could not be read. kwargs are passed to read_coords.
+    """
+    coords, errors = read_coords(source, **kwargs)
+    return {
+        key: Airfoil(name, Point(np.column_stack([data, np.zeros(len(data))])))
+        for key, (name, data) in coords.items()
+    }, errors
+
+
+def read_set(source: Union[str, Path], m: int=101, **kwargs) -> Tuple[AirfoilSet, Dict[str, str]]:
+    """An AirfoilSet of every readable file in a directory or zip archive, named by file name,
+    and the errors for those that could not be read or resampled. kwargs are passed to read_coords.
+    """
+    coords, errors = read_coords(source, **kwargs)
+    x = cosine_spacing(m)
+    names, upper, lower = [], [], []
+    for key, (name, data) in coords.items():
+        try:
+            u, l = AirfoilSet.resample_coords(data, x)
+        except Exception as ex:
+            errors[key] = f"{type(ex).__name__}: {ex}"
+            continue
+        names.append(key)
+        upper.append(u)
+        lower.append(l)
+    return AirfoilSet(names, x, np.array(upper).reshape(-1, m), np.array(lower).reshape(-1, m)), errors
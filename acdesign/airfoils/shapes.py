@@ -0,0 +1,81 @@
+from threading import Lock
+from typing import Callable, Dict, Union
+from geometry import Point
+from .airfoil import Airfoil
+
+
+class ShapeRegistry:
+    def __init__(self, loader: Callable[[str], Airfoil]=Airfoil.download):
+        """Interned unit chord airfoil shapes. Every section that uses an airfoil
+        references the same shape, whose points must be treated as read only.
+
+        Args:
+            loader (Callable[[str], Airfoil], optional): fetches an airfoil by name.
+                Defaults to Airfoil.download.
+        """
+        self.loader = loader
+        self._shapes: Dict[str, Airfoil] = {}
+        self._lock = Lock()
+
+    def __getitem__(self, name: str) -> Airfoil:
+        try:
+            return self._shapes[name]
+        except KeyError:
+            with self._lock:
+                if name not in self._shapes:
+                    self._shapes[name] = self.loader(name).set_chord(1.0)
+                return self._shapes[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._shapes
+
+    def __len__(self) -> int:
+        return len(self._shapes)
+
+    def clear(self):
+        with self._lock:
+            self._shapes = {}
+
+
+shapes = ShapeRegistry()
+
+
+class Section:
+    def __init__(self, shape: Union[str, Airfoil], chord: float, te_thickness: float):
+        """A shared unit chord shape plus the chord and trailing edge thickness to apply
+        to it. Absolute coordinates are calculated the first time points is read and kept,
+        so copies of a rib that share the section share them too.
+
+        Args:
+            shape (Union[str, Airfoil]): the unit chord shape, or the name of one to 
+                fetch from the shape registry the first time it is needed
+            chord (float): chord length
+            te_thickness (float): trailing edge thickness
+        """
+        self._shape = shape
+        self.chord = chord
+        self.te_thickness = te_thickness
+        self._points = None
+
+    @staticmethod
+    def create(name: str, chord: float, te_thickness: float):
+        return Section(name, chord, te_thickness)
+
+    @property
+    def resolved(self) -> bool:
+        return not isinstance(self._shape, str)
+
+    @property
+    def shape(self) -> Airfoil:
+        if not self.resolved:
+            self._shape = shapes[self._shape]
+        return self._shape
+
+    @property
+    def points(self) -> Point:
+        if self._points is None:
+            self._points = self.shape.set_chord(self.chord).set_te_thickness(self.te_thickness).points
+        return self._points
+
+    def scale(self, fac: float):
+        return Section(self._shape, self.chord * fac, self.te_thickness * fac)
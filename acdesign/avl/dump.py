@@ -1,35 +1,43 @@
 from .keywords import AVLParam, kwdict
 
 from acdesign.aircraft import Rib, Panel, Plane
+from acdesign.aircraft.frames import RibFrames
 from typing import NamedTuple, List
 
 from geometry import P0, Transformation, Euler
 import numpy as np
 
 
-def rib_dump_avl(rib: Rib, comms=False) -> List[NamedTuple]:
+def section_dump_avl(x, y, z, chord, incidence, comms=False) -> List[NamedTuple]:
     return kwdict["SECTION"].dump(kwdict["SECTION"].create(
-            rib.transform.translation.x[0],
-            rib.transform.translation.y[0],
-            rib.transform.translation.z[0], 
-            rib.chord,
-            np.degrees(rib.incidence)
+            x, y, z, chord, np.degrees(incidence)
         ), comms) # + consider adding airfoil stuff here
 
 
+def rib_dump_avl(rib: Rib, comms=False) -> List[NamedTuple]:
+    return section_dump_avl(
+        *rib.transform.translation.data[0], 
+        rib.chord, 
+        rib.incidence, 
+        comms
+    )
+
+
+def frames_dump_avl(frames: RibFrames, comms=False) -> List[NamedTuple]:
+    """SURFACE and SECTION lines for every panel in a RibFrames already in AVL axes"""
+    lines = []
+    incidence = frames.incidence
+    for i, name in enumerate(frames.names):
+        lines += kwdict["SURFACE"].dump(kwdict["SURFACE"].create(name, 1, 1.0, 16, -2.0), comms)
+        for j in frames.select(i):
+            lines += section_dump_avl(*frames.le.data[j], frames.chord[j], incidence[j], comms)
+    return lines
+
 
 def panel_dump_avl(panel: Panel, symm=True, comms=False) -> List[NamedTuple]:
     #AVL works in x aft, yright, z up, everythin global, so some conversions done here.
     con = Transformation(P0(), Euler(0, np.pi, 0))
-    return kwdict["SURFACE"].dump(kwdict["SURFACE"].create(panel.name, 1, 1.0, 16, -2.0), comms) \
-        + rib_dump_avl(
-            panel.inbd.apply_transformation(con.apply(panel.transform)), 
-            comms
-        ) \
-        + rib_dump_avl(
-            panel.otbd.apply_transformation(con.apply(panel.transform)), #.offset(Point(-panel.x, panel.y, -panel.z)), 
-            comms
-        )
+    return frames_dump_avl(RibFrames.build([panel]).apply_transformation(con), comms)
 
 
 def plane_dump_avl(plane: Plane, comms=False) -> List[NamedTuple]:
@@ -44,6 +52,5 @@ def plane_dump_avl(plane: Plane, comms=False) -> List[NamedTuple]:
         comms
     )[2 if comms else 1:]
         
-    for p in plane.panels:
-        ptups += panel_dump_avl(p, False, comms)
-    return ptups
\ No newline at end of file
+    con = Transformation(P0(), Euler(0, np.pi, 0))
+    return ptups + frames_dump_avl(plane.rib_frames.apply_transformation(con), comms)
\ No newline at end of file
@@ -2,6 +2,7 @@
 import numpy as np
 import pandas as pd
 from .operating_point import OperatingPoint
+from acdesign.atmosphere import Atmosphere
 from acdesign.airfoils.polar import UIUCPolars
 from typing import Dict, List
 from scipy.optimize import minimize
@@ -37,6 +38,51 @@ class WingAero:
         self.smc = self.S / self.b
         self.AR = self.b / self.smc
 
+    def re(self, op: OperatingPoint):
+        return op.atm.rho * op.V * self.smc / op.atm.mu
+
+    @staticmethod
+    def _spanload(spanload, n):
+        sload = spanload(np.linspace(0,1,n))
+        return sload / np.mean(sload) 
+
+    def _slices(self, n):
+        return [(int(n*s0), int(n*s1)) for s0, s1 in zip(self.rib_locs[:-1], self.rib_locs[1:])]
+
+    def CLmax(
+        self, 
+        op: OperatingPoint, 
+        spanload=lambda yb: np.sqrt(1-yb**2),
+        n=100
+    ):
+        """Calculate the wing CLmax, the total lift coefficient at which the local Cl
+        first reaches the section Clmax somewhere along the span.
+
+        Args:
+            op (OperatingPoint): operating point, sets the Reynolds number
+            spanload (_type_, optional): function to calculate the spanload distribution
+                Defaults to lambdayb:np.sqrt(1-yb**2).
+            n (int, optional): number of spanwise points to check. Defaults to 100.
+
+        Returns:
+            float: wing CLmax
+        """
+        return self.clmax(self.re(op), spanload, n)
+
+    def clmax(
+        self,
+        re: float,
+        spanload=lambda yb: np.sqrt(1-yb**2),
+        n=100
+    ):
+        """The wing CLmax at a Reynolds number, see CLmax"""
+        sload = self._spanload(spanload, n)
+        clmax = np.full(n, np.inf)
+        for s, p in zip(self._slices(n), self.polars):
+            clmax[s[0]:s[1]] = p.clmax(re)
+        loaded = sload > 0
+        return np.min(clmax[loaded] / sload[loaded])
+
     def __call__(
         self, 
         op: OperatingPoint, 
@@ -57,27 +103,21 @@ class WingAero:
         Returns:
             dict: containing the wing S, c, Cl, Cd, re and Cm
         """
-        re = op.atm.rho * op.V * self.smc / op.atm.mu
-        
-        sload = spanload(np.linspace(0,1,n))
-        sload = sload / np.mean(sload) 
+        re = self.re(op)
         
-        polars = [p.lookup(re, cl * sload) for p in self.polars]
+        cls = cl * self._spanload(spanload, n)
         
-        sst = [(int(n*s0), int(n*s1)) for s0, s1 in zip(self.rib_locs[:-1], self.rib_locs[1:])]
+        sst = self._slices(n)
         
-        res = pd.concat([
-            p.iloc[s[0]:s[1]] for s, p in zip(sst, polars)
-        ]).mean()
-
-
+        res = [p.evaluate(re, cls[s[0]:s[1]]) for s, p in zip(sst, self.polars)]
+        res = {k: np.mean(np.concatenate([getattr(r, k) for r in res])) for k in ["Cl", "Cd", "Cm"]}
 
         return dict(
             S=self.S, 
             c=self.smc,
-            Cl=res.Cl,
-            Cd=res.Cd + res.Cl**2 / (np.pi * self.AR),
-            Cm=res.Cm,
+            Cl=res["Cl"],
+            Cd=res["Cd"] + res["Cl"]**2 / (np.pi * self.AR),
+            Cm=res["Cm"],
             re=re
         )
 
@@ -165,7 +205,20 @@ class AircraftAero:
 
     @property
     def CLmax(self):
-        return 1.5
+        """wing CLmax at the highest Reynolds number in the section stall tables"""
+        return self.wing.clmax(max(p.stall_table.re.max() for p in self.wing.polars))
+
+    def clmax_at(self, op: OperatingPoint):
+        """wing CLmax at the Reynolds number of the operating point"""
+        return self.wing.CLmax(op)
+
+    def stall_speed(self, atm: Atmosphere, mass: float, niter: int=5):
+        """level flight stall speed, iterated from the CLmax property as CLmax depends 
+        on the Reynolds number"""
+        V = np.sqrt(2*9.81*mass/(atm.rho * self.S * self.CLmax))
+        for _ in range(niter):
+            V = np.sqrt(2*9.81*mass/(atm.rho * self.S * self.clmax_at(OperatingPoint(atm, V))))
+        return V
 
     @property
     def S(self):
@@ -9,11 +9,17 @@ from acdesign.performance.aero import FuseAero, WingAero, AircraftAero
 from acdesign.performance.motor import Propulsion
 from acdesign.performance.operating_point import OperatingPoint
 from acdesign.performance.mass_estimation import estimate_mass
-from acdesign.airfoils.polar import UIUCPolars
+from acdesign.airfoils.registry import polars
+
+_default_polars = dict(clarky="CLARKYB", sa7038="SA7038", e472="E472")
+
+
+def __getattr__(name):
+    # the default polars are loaded from the registry on first use rather than on import
+    if name in _default_polars:
+        return polars[_default_polars[name]]
+    raise AttributeError(f"module {__name__} has no attribute {name}")
 
-clarky = UIUCPolars.local("CLARKYB")
-sa7038 = UIUCPolars.local("SA7038")
-e472 = UIUCPolars.local("E472")
 
 class Performance:
     def __init__(self, op: OperatingPoint, aero: AircraftAero, mot: Propulsion, mass: float, wind:float):
@@ -32,9 +38,10 @@ class Performance:
         self.preq = self.D * self.op.V
         self.endurance = self.mot.endurance(self.preq)
         self.range = (self.op.V - self.wind) * self.endurance
-        self.stall = self.CL > self.aero.CLmax
-        self.stall_speed = np.sqrt(2*9.81*self.mass/(1.225 * self.aero.S * self.aero.CLmax))
-        self.cruise_stall_speed = np.sqrt(2*9.81*self.mass/(self.op.atm.rho * self.aero.S * self.aero.CLmax))
+        self.CLmax = self.aero.clmax_at(op)
+        self.stall = self.CL > self.CLmax
+        self.stall_speed = self.aero.stall_speed(Atmosphere.alt(0), self.mass)
+        self.cruise_stall_speed = self.aero.stall_speed(self.op.atm, self.mass)
 
         
     @staticmethod
@@ -44,13 +51,13 @@ class Performance:
             WingAero(
                 b, 
                 S, 
-                [clarky,sa7038],
+                [polars["CLARKYB"], polars["SA7038"]],
                 [0, 1/3, 1]
             ),
             WingAero(
                 0.2*S,
                 np.sqrt(0.2*S/3.5),
-                [e472],
+                [polars["E472"]],
                 [0,1]
             ),
             FuseAero(
@@ -87,7 +94,7 @@ class Performance:
             b=self.aero.wing.b,
             S=self.aero.wing.S,
             AR=self.aero.wing.b**2 / self.aero.wing.S,
-            CLMax=self.aero.CLmax,
+            CLMax=self.CLmax,
             mass=self.mass,
             cells=self.mot.lipo_cells,
             capacity=self.mot.Ah,
@@ -0,0 +1,49 @@
+"""Per-lookup cost of UIUCPolars.lookup against the old per-call griddata approach.
+
+run from the repository root:
+    python examples/polar_lookup_benchmark.py
+"""
+from acdesign.airfoils.polar import UIUCPolars
+from scipy.interpolate import griddata
+from timeit import timeit
+import numpy as np
+import pandas as pd
+
+
+def griddata_lookup(polars: UIUCPolars, recl: np.ndarray) -> pd.DataFrame:
+    """the lookup as it was before the interpolators were prebuilt"""
+    def _interp(x, y, z):
+        res = griddata(np.column_stack([x, y]), z.to_numpy(), recl, "linear")
+        nans = np.isnan(res)
+        if np.any(nans):
+            res[nans] = griddata(np.column_stack([x, y]), z.to_numpy(), recl, "nearest")[nans]
+        return res
+
+    ps = polars.pslift
+    return pd.DataFrame(
+        np.column_stack([
+            recl[:, 0],
+            _interp(ps.re, ps.Cl, ps.alpha),
+            recl[:, 1],
+            _interp(ps.re, ps.Cl, ps.Cm),
+            _interp(polars.drag.re, polars.drag.Cl, polars.drag.Cd),
+        ]),
+        columns=["re", "alpha", "Cl", "Cm", "Cd"]
+    )
+
+
+if __name__ == "__main__":
+    polars = UIUCPolars.local("CLARKYB")
+
+    # the same shape of lookup that WingAero.__call__ makes on every trim
+    recl = np.column_stack([np.full(100, 3.5e5), 0.5 * np.sqrt(1 - np.linspace(0, 1, 100)**2)])
+
+    n = 200
+    before = timeit(lambda: griddata_lookup(polars, recl), number=n) / n
+    after = timeit(lambda: polars.apply(recl), number=n) / n
+
+    np.testing.assert_allclose(griddata_lookup(polars, recl), polars.apply(recl))
+
+    print(f"griddata per lookup:      {before * 1e3:8.3f} ms")
+    print(f"prebuilt per lookup:      {after * 1e3:8.3f} ms")
+    print(f"speedup:                  {before / after:8.1f} x")
@@ -10,7 +10,7 @@ You should have received a copy of the GNU General Public License along with
 this program. If not, see <http://www.gnu.org/licenses/>.
 """
 
-from setuptools import setup
+from setuptools import setup, find_packages
 
 setup(
    name='acdesign',
@@ -18,7 +18,7 @@ setup(
    description='Tools for aircraft design',
    author='Thomas David',
    author_email='thomasdavid0@gmail.com',
-   packages=['acdesign'],
+   packages=find_packages(include=['acdesign', 'acdesign.*']),
    include_package_data = True,
-   package_data = {'': ['data/*']},
+   package_data = {'acdesign': ['data/*', 'data/uiuc/*', 'airfoils/uiuc_list.txt']},
 )
\ No newline at end of file
@@ -15,4 +15,11 @@ def _panel():
         ),
         [Rib.create("e1200-il", 300, Point.zeros(), 0, 4),
         Rib.create("e1200-il", 300, Point(200, 500, 0), 0, 4)]
-    )
\ No newline at end of file
+    )
+
+@pytest.fixture
+def offline_airfoils(monkeypatch, tmp_path):
+    """read airfoil coordinates from tests/data rather than downloading them"""
+    monkeypatch.setenv("ACDESIGN_CACHE", str(tmp_path))
+    monkeypatch.setenv("ACDESIGN_AIRFOIL_MIRROR", "tests/data")
+    monkeypatch.setenv("ACDESIGN_OFFLINE", "1")
@@ -0,0 +1,34 @@
+import shutil
+import pytest
+from acdesign.aircraft.plane import ConventionalPlane
+from acdesign.aircraft.bulk import flatten, load_planes, load_table
+from .conftest import offline_airfoils
+
+
+@pytest.fixture
+def design_dir(tmp_path):
+    for name in ["buddi_tilt", "buddi_test"]:
+        shutil.copy(f"acdesign/data/{name}.json", tmp_path / f"{name}.json")
+    (tmp_path / "broken.json").write_text("{not json")
+    return tmp_path
+
+
+def test_flatten():
+    flat = flatten(dict(a=1, b=dict(c=[1, 2]), d=[dict(name="x", e=3), dict(e=4)]))
+    assert flat == {"a": 1, "b.c": [1, 2], "d.x.name": "x", "d.x.e": 3, "d.1.e": 4}
+
+
+def test_load_planes(design_dir, offline_airfoils):
+    planes, errors = load_planes(design_dir, processes=False)
+    assert sorted(planes) == ["buddi_test", "buddi_tilt"]
+    assert list(errors) == ["broken"]
+    assert isinstance(planes["buddi_tilt"], ConventionalPlane)
+    assert planes["buddi_tilt"].dumpd() == ConventionalPlane.parse_json("acdesign/data/buddi_tilt.json").dumpd()
+
+
+def test_load_table(design_dir):
+    table, errors = load_table(design_dir, processes=True, max_workers=2)
+    assert list(table.index) == ["buddi_test", "buddi_tilt"]
+    assert list(errors) == ["broken"]
+    assert table.loc["buddi_tilt", "name"] == "BUDDI_tilt"
+    assert table.loc["buddi_tilt", "panels.wing_outer.otbd.chord"] == 200
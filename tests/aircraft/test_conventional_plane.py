@@ -1,6 +1,7 @@
 from pytest import approx, fixture
 from acdesign.aircraft.plane import ConventionalPlane
 from acdesign.aircraft.wing import Wing
+from .conftest import offline_airfoils
 
 @fixture
 def cplane():
@@ -16,3 +17,17 @@ def test_cplane_wing(cplane):
 
 
 
+
+
+def test_parse_json_without_airfoils(offline_airfoils):
+    plane = ConventionalPlane.parse_json("acdesign/data/buddi_tilt.json")
+    assert plane.sref > 0
+    assert plane.dumpd()["panels"][0]["inbd"]["airfoil"] == "clarkysm-il"
+    assert not any(r.section.resolved for p in plane.panels for r in p.ribs)
+
+
+def test_dump_json_round_trip(cplane, tmp_path, offline_airfoils):
+    cplane.dump_json(tmp_path / "plane.json")
+    with open(tmp_path / "plane.json") as f:
+        plane = ConventionalPlane.parse_json(f)
+    assert plane.dumpd() == cplane.dumpd()
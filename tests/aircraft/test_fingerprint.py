@@ -0,0 +1,42 @@
+import pytest
+import numpy as np
+from acdesign.aircraft.plane import ConventionalPlane
+from acdesign.aircraft.fingerprint import canonical, fingerprint
+from .conftest import offline_airfoils
+
+
+@pytest.fixture
+def cplane(offline_airfoils):
+    return ConventionalPlane.parse_json("acdesign/data/buddi_tilt.json")
+
+
+def test_canonical():
+    assert canonical(dict(a=np.int64(400), b=(-1e-12, 1.23456789))) == dict(a=400.0, b=[0.0, 1.235])
+    assert canonical(dict(a="E472-il", b=True)) == dict(a="E472-il", b=True)
+
+
+def test_fingerprint():
+    assert fingerprint(dict(a=1, b=2)) == fingerprint(dict(b=2.0000001, a=1))
+    assert fingerprint(dict(a=1, b=2)) != fingerprint(dict(a=1, b=2.001))
+
+
+def test_plane_fingerprint(cplane, tmp_path):
+    cplane.dump_json(tmp_path / "plane.json")
+    reloaded = ConventionalPlane.parse_json(tmp_path / "plane.json")
+    assert reloaded.fingerprint == cplane.fingerprint
+    assert cplane.scale(1 + 1e-12).fingerprint == cplane.fingerprint
+    assert cplane.scale(1.01).fingerprint != cplane.fingerprint
+
+
+def test_component_fingerprints(cplane):
+    assert cplane.wing.fingerprint != cplane.tail.fingerprint
+    assert cplane.panels[0].fingerprint == cplane.scale(1).panels[0].fingerprint
+    assert cplane.panels[0].inbd.fingerprint == cplane.panels[0].otbd.fingerprint
+    assert cplane.panels[1].inbd.fingerprint != cplane.panels[1].otbd.fingerprint
+    assert cplane.masses[0].fingerprint == cplane.scale(1).masses[0].fingerprint
+
+
+def test_fingerprint_survives_save(cplane, tmp_path):
+    plane = cplane.scale(1.2345678)
+    plane.dump_json(tmp_path / "plane.json")
+    assert ConventionalPlane.parse_json(tmp_path / "plane.json").fingerprint == plane.fingerprint
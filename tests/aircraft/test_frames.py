@@ -0,0 +1,46 @@
+from acdesign.aircraft.plane import ConventionalPlane
+from geometry import Transformation, Euler, P0
+import numpy as np
+from pytest import fixture
+
+
+@fixture
+def plane():
+    return ConventionalPlane.parse_json("acdesign/data/buddi_tilt.json")
+
+
+def test_build(plane):
+    frames = plane.rib_frames
+    assert len(frames) == sum(len(p.ribs) for p in plane.panels)
+    assert frames.names == [p.name for p in plane.panels]
+    i = 0
+    for p in plane.panels:
+        for r in p.ribs:
+            np.testing.assert_allclose(frames.transform.data[i], p.transform.apply(r.transform).data[0], atol=1e-9)
+            i += 1
+
+
+def test_cached(plane):
+    assert plane.rib_frames is plane.rib_frames
+    assert plane.wing.rib_frames is plane.wing.rib_frames
+
+
+def test_chord_vector(plane):
+    frames = plane.rib_frames
+    np.testing.assert_allclose(abs(frames.chord_vector), frames.chord)
+    np.testing.assert_allclose(abs(frames.te - frames.le), frames.chord)
+
+
+def test_incidence(plane):
+    con = Transformation(P0(), Euler(0, np.pi, 0))
+    frames = plane.rib_frames.apply_transformation(con)
+    expected = [
+        r.apply_transformation(con.apply(p.transform)).incidence
+        for p in plane.panels for r in p.ribs
+    ]
+    np.testing.assert_allclose(frames.incidence, expected, atol=1e-9)
+
+
+def test_select(plane):
+    frames = plane.wing.rib_frames
+    np.testing.assert_array_equal(frames.select(1), [2, 3])
@@ -0,0 +1,63 @@
+from acdesign.aircraft.wing import Wing
+from acdesign.aircraft.mesh import LoftedMesh, section_coords
+from collections import Counter
+import numpy as np
+from pytest import fixture
+from .conftest import offline_airfoils
+
+
+@fixture
+def wing(offline_airfoils):
+    return Wing.straight_taper("wing", 2000, 400000, 0.6, 100, ["goe222", "goe222"], dihedral=3)
+
+
+def edge_counts(tris: np.ndarray) -> Counter:
+    edges = Counter()
+    for t in tris:
+        for a, b in [(0, 1), (1, 2), (2, 0)]:
+            edges[tuple(sorted([tuple(t[a]), tuple(t[b])]))] += 1
+    return edges
+
+
+def test_section_coords(wing):
+    coords = section_coords(wing.panels[0].ribs, 21)
+    assert coords.shape == (2, 41, 2)
+    np.testing.assert_allclose(coords[:, 20], 0, atol=1e-9)
+    np.testing.assert_allclose(coords[:, 0, 0], [p.chord for p in wing.panels[0].ribs])
+
+
+def test_mesh_ends(wing):
+    mesh = LoftedMesh.from_plane(wing, chordwise=21, spanwise=4)
+    frames = wing.rib_frames
+    np.testing.assert_allclose(mesh.inbd[0, 20], frames.le.data[0], atol=1e-9)
+    np.testing.assert_allclose(mesh.otbd[0, 20], frames.le.data[1], atol=1e-9)
+    np.testing.assert_allclose(mesh.otbd[0, 0], frames.te.data[1], atol=2)
+
+
+def test_triangle_count(wing):
+    mesh = LoftedMesh.from_plane(wing, chordwise=21, spanwise=5)
+    tris = np.concatenate(list(mesh.triangles(max_triangles=100)))
+    assert len(tris) == len(mesh)
+
+
+def test_watertight(wing):
+    mesh = LoftedMesh.from_plane(wing, chordwise=11, spanwise=3)
+    tris = np.concatenate(list(mesh.triangles(max_triangles=50)))
+    assert set(edge_counts(tris).values()) == {2}
+
+
+def test_write_stl(wing, tmp_path):
+    mesh = LoftedMesh.from_plane(wing, chordwise=21, spanwise=4)
+    mesh.write_stl(tmp_path / "wing.stl", max_triangles=100)
+    tris = LoftedMesh.read_stl(tmp_path / "wing.stl")
+    np.testing.assert_allclose(tris, np.concatenate(list(mesh.triangles(max_triangles=100))), rtol=1e-6, atol=1e-3)
+    assert (tmp_path / "wing.stl").stat().st_size == 84 + 50 * len(mesh)
+
+
+def test_write_obj(wing, tmp_path):
+    mesh = LoftedMesh.from_plane(wing, chordwise=11, spanwise=2)
+    mesh.write_obj(tmp_path / "wing.obj", max_triangles=50)
+    lines = (tmp_path / "wing.obj").read_text().splitlines()
+    assert sum(l.startswith("v ") for l in lines) == 3 * len(mesh)
+    assert sum(l.startswith("f ") for l in lines) == len(mesh)
+    assert lines[-1].split()[-1] == str(3 * len(mesh))
@@ -70,4 +70,25 @@ def test_props():
 def test_simple():
     panel = Panel.simple("test", 1000, 100, Rib.simple("rae101-il", 100, 5), Rib.simple("rae101-il", 50, 5))
 
-    assert panel.area == 1000 * 75
\ No newline at end of file
+    assert panel.area == 1000 * 75
+
+def test_props_lazy(_panel):
+    assert not _panel._props.done
+    assert _panel.area == 500.0*300.0
+    assert _panel._props.done
+
+
+def test_offset_shares_props(_panel):
+    _panel.area
+    opanel = _panel.offset(Point(10, 20, 30))
+    assert not opanel._props.done
+    assert opanel.pMAC is _panel.pMAC
+    assert opanel.ymax == _panel.ymax + 20
+    assert opanel.transform.translation == Point(210, 120, 130)
+
+
+def test_pickle(_panel):
+    import pickle
+    ppanel = pickle.loads(pickle.dumps(_panel.offset(Point(0, 10, 0))))
+    assert ppanel.area == _panel.area
+    assert ppanel.ymax == _panel.ymax + 10
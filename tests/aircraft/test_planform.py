@@ -0,0 +1,63 @@
+from acdesign.aircraft import Rib
+from acdesign.aircraft.wing import Wing
+from acdesign.aircraft.planform import Planform
+from geometry import Point
+import numpy as np
+from pytest import approx, fixture
+
+
+@fixture
+def wing():
+    return Wing.from_ribs([
+        Rib.create("e174-il", 200, Point(0,   0,   0), 1),
+        Rib.create("e174-il", 200, Point(0,   80,  0), 1),
+        Rib.create("e174-il", 180, Point(20,  180, 0), 1),
+        Rib.create("e174-il", 160, Point(40,  400, 0), 1),
+        Rib.create("e174-il", 100, Point(100, 800, 0), 1),
+    ])
+
+
+@fixture
+def planform(wing):
+    return Planform.from_wing(wing)
+
+
+def test_from_wing(planform):
+    assert len(planform) == 4
+    assert planform.chord.shape == (4, 2)
+    assert planform.airfoils == ["e174-il"]
+    np.testing.assert_array_equal(planform.airfoil, 0)
+
+
+def test_wing_props(wing, planform):
+    for k in ["S", "b", "AR", "SMC", "tr", "MAC"]:
+        assert getattr(planform, k) == approx(getattr(wing, k))
+    np.testing.assert_allclose(planform.pMAC, wing.pMAC.data[0])
+
+
+def test_panel_props(wing, planform):
+    props = planform.panel_props()
+    for p in wing.panels:
+        for k in ["area", "semispan", "taper_ratio", "le_sweep_angle", "MAC", "incidence", "dihedral"]:
+            assert props.loc[p.name, k] == approx(getattr(p, k), abs=1e-9)
+
+
+def test_roundtrip(wing, planform):
+    wing2 = planform.to_wing()
+    assert Planform.from_wing(wing2).S == approx(wing.S)
+    for p1, p2 in zip(wing.panels, wing2.panels):
+        assert p2.dihedral == approx(p1.dihedral, abs=1e-9)
+        assert p2.incidence == approx(p1.incidence, abs=1e-9)
+        assert p2.tip.chord == p1.tip.chord
+
+
+def test_mutate(planform):
+    pf = planform.copy()
+    pf.chord[:, :] *= 2
+    assert pf.S == approx(planform.S * 2)
+    assert pf.b == planform.b
+
+
+def test_scale(planform):
+    assert planform.scale(2).b == approx(planform.b * 2)
+    assert planform.scale(2).S == approx(planform.S * 4)
@@ -1,8 +1,11 @@
+import pytest
 from pytest import fixture, approx
 from geometry import Point
 import numpy as np
 from acdesign.aircraft.rib import Rib
 from acdesign.aircraft.panel import Panel
+from acdesign.airfoils.airfoil import Airfoil
+from .conftest import offline_airfoils
 
 _rib = {
     "airfoil": "a18-il",
@@ -27,4 +30,42 @@ def test_create_rib(rib):
 
 def test_simple():
     rib = Rib.simple("rae101-il", 200, 5)
-    assert rib.chord == 200
\ No newline at end of file
+    assert rib.chord == 200
+
+def test_shared_shape(offline_airfoils):
+    r1 = Rib.create("goe222", 200, Point(0, 0, 0), 1, 3)
+    r2 = Rib.simple("goe222", 100, 1)
+    assert r1.section.shape is r2.section.shape
+    assert r1.section.shape.chord == 1
+
+
+def test_lazy_points(offline_airfoils):
+    rib = Rib.create("goe222", 200, Point(0, 0, 0), 1, 3)
+    expected = Airfoil.download("goe222").set_chord(200).set_te_thickness(1).points
+    np.testing.assert_array_equal(rib.points.data, expected.data)
+    assert rib.te_thickness == 1
+
+
+def test_transforms_share_section(offline_airfoils):
+    rib = Rib.create("goe222", 200, Point(0, 0, 0), 1, 3)
+    assert rib.offset(Point(1, 2, 3)).section is rib.section
+    assert rib.rename("other").section is rib.section
+    srib = rib.scale(2)
+    assert srib.section.shape is rib.section.shape
+    assert srib.chord == 400
+    np.testing.assert_allclose(srib.points.data, rib.points.data * 2)
+
+
+def test_unresolved_until_points_read(offline_airfoils):
+    rib = Rib.create("not_an_airfoil", 200, Point(0, 0, 0), 1, 3)
+    assert not rib.section.resolved
+    assert rib.dumpd()["chord"] == 200
+    assert not rib.scale(2).section.resolved
+    with pytest.raises(FileNotFoundError):
+        rib.points
+
+
+def test_points_kept(offline_airfoils):
+    rib = Rib.create("goe222", 200, Point(0, 0, 0), 1, 3)
+    assert rib.points is rib.points
+    assert rib.offset(Point(1, 2, 3)).points is rib.points
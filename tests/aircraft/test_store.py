@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+from pytest import approx
+from acdesign.aircraft.plane import Plane, ConventionalPlane
+from acdesign.aircraft.store import DesignStore, tabulate
+from .conftest import offline_airfoils
+
+
+@pytest.fixture
+def planes(offline_airfoils):
+    tilt = ConventionalPlane.parse_json("acdesign/data/buddi_tilt.json")
+    test = ConventionalPlane.parse_json("acdesign/data/buddi_test.json")
+    return [(tilt if i % 2 else test).scale(f) for i, f in enumerate(np.linspace(0.5, 1.5, 25))]
+
+
+@pytest.fixture
+def store(tmp_path, planes):
+    store = DesignStore(tmp_path / "store")
+    store.append(planes, chunksize=10)
+    return store
+
+
+def test_tabulate(planes):
+    tables = tabulate(planes[:2], start=5)
+    assert list(tables["designs"].variant) == [5, 6]
+    assert tables["designs"].AR.iloc[1] == approx(planes[1].wing.AR)
+    assert len(tables["panels"]) == 8
+    assert len(tables["ribs"]) == 16
+
+
+def test_append(store, planes):
+    assert len(store) == 25
+    assert len(store.chunks) == 3
+    assert store.append(planes[:2]) == [25, 26]
+    assert len(store) == 27
+
+
+def test_query(store, planes):
+    ar = np.array([p.wing.AR for p in planes])
+    res = DesignStore(store.path).query(AR=(13, None))
+    assert list(res.index) == list(np.flatnonzero(ar >= 13))
+    assert len(store.query(dict(tail="e472-il"))) == 12
+    assert len(store.query(dict(fin="e472-il"))) == 0
+    assert len(store.query(dict(tail="E472-il"), S=(None, 2e5))) == \
+        sum(1 for p in planes[1::2] if p.wing.S <= 2e5)
+
+
+def test_dumpd(store, planes):
+    assert store.dumpd(13) == planes[13].dumpd()
+    assert store.dumpd(0) == planes[0].dumpd()
+    with pytest.raises(KeyError):
+        store.dumpd(25)
+
+
+def test_get(store, planes):
+    plane = store.get(17)
+    assert isinstance(plane, ConventionalPlane)
+    assert plane.wing.S == approx(planes[17].wing.S)
+    assert type(store.get(17, conventional=False)) is Plane
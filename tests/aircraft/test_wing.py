@@ -83,3 +83,12 @@ def test_from_panels():
     p2 = Panel.simple("test", 500, 100, Rib.simple("rae101-il", 50, 5), Rib.simple("rae101-il", 50, 5))
     w = Wing.from_panels([p1, p2])
     assert w.b == 2000
+
+
+def test_offset_shares_panel_props(ribs):
+    wing = Wing.from_ribs(ribs)
+    owing = wing.offset(Point(100, 0, 0))
+    assert not owing._props.done
+    assert all(p1.pMAC is p2.pMAC for p1, p2 in zip(wing.panels, owing.panels))
+    assert owing.S == wing.S
+    assert owing.pMAC.x[0] == approx(wing.pMAC.x[0] + 100)
@@ -0,0 +1,24 @@
+from pytest import fixture
+from acdesign.airfoils.airfoil_set import cosine_spacing
+from acdesign.airfoils.airfoil import Airfoil
+from acdesign.airfoils.polar import UIUCPolars
+from geometry import Point
+import numpy as np
+
+
+@fixture(scope="session")
+def s1223():
+    return UIUCPolars.from_files('tests/airfoils/S1223.LFT', 'tests/airfoils/S1223.DRG')
+
+
+@fixture(scope="session")
+def naca4():
+    """builds NACA 4 digit airfoils from the camber m, its position p and the thickness t"""
+    def naca4(m: float, p: float, t: float, n: int=400) -> Airfoil:
+        x = cosine_spacing(n)
+        yt = 5 * t * (0.2969 * np.sqrt(x) - 0.1260 * x - 0.3516 * x**2 + 0.2843 * x**3 - 0.1036 * x**4)
+        yc = np.where(x < p, m / p**2 * (2 * p * x - x**2), m / (1 - p)**2 * (1 - 2 * p + 2 * p * x - x**2)) if m > 0 else 0 * x
+        xs = np.concatenate([x[::-1], x[1:]])
+        ys = np.concatenate([(yc + yt)[::-1], (yc - yt)[1:]])
+        return Airfoil(f"naca{round(m*100)}{round(p*10) if m > 0 else 0}{round(t*100):02d}", Point(np.column_stack([xs, ys, np.zeros(len(xs))])))
+    return naca4
@@ -74,4 +74,8 @@ def test_mean_camber(foil):
     assert meanc[0] == foil.le_point
     assert meanc[-1] == foil.te_point
 
-    
\ No newline at end of file
+    
+
+def test_btm_func(foil):
+    btm = foil.btm_surface
+    np.testing.assert_allclose(foil.btm_func()(btm.x), btm.y)
@@ -0,0 +1,46 @@
+from pytest import fixture, approx
+from acdesign.airfoils.airfoil_set import AirfoilSet
+import numpy as np
+
+
+@fixture
+def nacas(naca4):
+    return AirfoilSet.from_airfoils([naca4(0, 0, 0.12), naca4(0, 0, 0.15)])
+
+
+def test_shape(nacas):
+    assert nacas.upper.shape == (2, 101)
+    assert nacas.coords.shape == (2, 201, 2)
+
+
+def test_thickness(nacas):
+    np.testing.assert_allclose(nacas.max_thickness, [0.12, 0.15], atol=1e-4)
+    np.testing.assert_allclose(nacas.max_thickness_x, 0.3, atol=0.01)
+    np.testing.assert_allclose(nacas.max_camber, 0, atol=1e-12)
+
+
+def test_area(nacas):
+    # area of a NACA 4 digit section is ~0.685 t c^2
+    np.testing.assert_allclose(nacas.area, 0.685 * np.array([0.12, 0.15]), rtol=0.01)
+
+
+def test_le_radius(nacas):
+    np.testing.assert_allclose(nacas.le_radius, 1.1019 * np.array([0.12, 0.15])**2, rtol=0.05)
+
+
+def test_inertia(nacas):
+    assert nacas.centroid[:, 1] == approx([0, 0], abs=1e-12)
+    ixx = nacas.inertia[:, 0]
+    assert ixx[1] / ixx[0] == approx((0.15 / 0.12)**3, rel=1e-3)
+
+
+def test_getitem(nacas):
+    af = nacas[0]
+    assert af.name == "naca0012"
+    assert af.thickness == approx(0.12, abs=1e-3)
+
+
+def test_from_directory():
+    afs = AirfoilSet.from_directory("tests/data", "*.dat")
+    assert len(afs) == 1
+    assert afs.summary().max_thickness.iloc[0] == approx(0.185, abs=1e-3)
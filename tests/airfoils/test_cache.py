@@ -0,0 +1,84 @@
+from pytest import fixture, raises
+from acdesign.airfoils.cache import PolarCache, CoordinateCache, file_hash
+from acdesign.airfoils.airfoil import Airfoil
+from pathlib import Path
+from acdesign.airfoils.polar import LFTDRGParser, UIUCPolars
+import pandas as pd
+import shutil
+
+
+@fixture
+def cache(tmp_path):
+    return PolarCache(tmp_path / "polars")
+
+
+def test_read_roundtrip(cache):
+    parsed = cache.read('tests/airfoils/S1223.LFT', LFTDRGParser.parse_file)
+    assert cache.path('tests/airfoils/S1223.LFT').exists()
+    cached = cache.read('tests/airfoils/S1223.LFT', lambda f: None)
+    pd.testing.assert_frame_equal(parsed, cached)
+    assert "pre_stall" in cached.columns
+
+
+def test_rebuild_on_change(cache, tmp_path):
+    file = tmp_path / "S1223.LFT"
+    shutil.copy('tests/airfoils/S1223.LFT', file)
+    first = cache.path(file)
+    cache.read(file, LFTDRGParser.parse_file)
+
+    with open(file, "a") as f:
+        f.write("\n")
+    assert cache.path(file) != first
+    assert not cache.path(file).exists()
+    cache.read(file, LFTDRGParser.parse_file)
+    assert cache.path(file).exists()
+
+
+def test_from_files_cached(cache):
+    polars = UIUCPolars.from_files('tests/airfoils/S1223.LFT', 'tests/airfoils/S1223.DRG', cache=cache)
+    assert len(list(cache.directory.glob("*.npz"))) == 2
+    uncached = UIUCPolars.from_files('tests/airfoils/S1223.LFT', 'tests/airfoils/S1223.DRG', cache=None)
+    pd.testing.assert_frame_equal(polars.drag, uncached.drag)
+
+
+@fixture
+def coords(tmp_path):
+    return CoordinateCache(tmp_path / "airfoils", mirror="tests/data", offline=True)
+
+
+def _no_download(name):
+    raise AssertionError("tried to download")
+
+
+def test_coordinates_from_mirror(coords):
+    assert coords.read("goe222", _no_download) == Path("tests/data/goe222.dat")
+
+
+def test_coordinates_offline_missing(coords):
+    with raises(FileNotFoundError):
+        coords.read("clarky", _no_download)
+
+
+def test_coordinates_store(tmp_path):
+    coords = CoordinateCache(tmp_path / "airfoils", offline=False)
+    downloads = []
+    def download(name):
+        downloads.append(name)
+        return "tests/data/seligdatfile.txt"
+
+    path = coords.read("n63a108", download)
+    assert path.stem == file_hash("tests/data/seligdatfile.txt")
+    assert coords.read("n63a108", download) == path
+    assert downloads == ["n63a108"]
+    assert Airfoil.parse_selig(path).name == Airfoil.parse_selig("tests/data/seligdatfile.txt").name
+
+
+def test_prefetch_reports_failures(coords):
+    failed = coords.prefetch(["goe222", "clarky"], _no_download)
+    assert list(failed.keys()) == ["clarky"]
+
+
+def test_path_versioned(cache, monkeypatch):
+    first = cache.path('tests/airfoils/S1223.LFT')
+    monkeypatch.setattr(PolarCache, "version", PolarCache.version + 1)
+    assert cache.path('tests/airfoils/S1223.LFT') != first
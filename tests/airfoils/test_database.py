@@ -0,0 +1,30 @@
+from pytest import fixture
+from acdesign.airfoils.database import PolarDatabase
+from acdesign.airfoils.polar import UIUCPolars
+import numpy as np
+
+
+@fixture
+def db(tmp_path):
+    PolarDatabase.pack("tests/airfoils", cache=None).save(tmp_path / "polars")
+    return PolarDatabase.open(tmp_path / "polars")
+
+
+def test_pack(db):
+    assert db.names == ["S1223"]
+    assert isinstance(db.data, np.memmap)
+    assert db.data.shape[1] == len(PolarDatabase.columns)
+
+
+def test_tables(db):
+    polars = UIUCPolars.from_files('tests/airfoils/S1223.LFT', 'tests/airfoils/S1223.DRG', cache=None)
+    np.testing.assert_array_equal(db.lift("S1223").Cl, polars.lift.Cl)
+    np.testing.assert_array_equal(db.drag("S1223").Cd, polars.drag.Cd)
+    np.testing.assert_array_equal(db.lift("S1223").pre_stall, polars.lift.pre_stall)
+
+
+def test_getitem(db):
+    polars = db["S1223"]
+    assert isinstance(polars, UIUCPolars)
+    assert db["S1223"] is polars
+    assert "S1223" in db
@@ -0,0 +1,47 @@
+from pytest import fixture
+from acdesign.airfoils.fit import PolarFit, PolyCurves
+import numpy as np
+
+
+@fixture(scope="module")
+def fit(s1223):
+    return PolarFit.fit(s1223)
+
+
+def test_polycurves_exact():
+    re = np.repeat([1e5, 1e6], 5)
+    x = np.tile(np.linspace(0, 1, 5), 2)
+    curves = PolyCurves.fit(re, x, np.where(re==1e5, 1 + x**2, 3 + x**2), 2)
+    np.testing.assert_allclose(curves(1e5, 0.5), 1.25)
+    np.testing.assert_allclose(curves(np.sqrt(1e5 * 1e6), 0.5), 2.25)
+    np.testing.assert_allclose(curves(1e7, 0.5), 3.25)
+
+
+def test_residuals(fit):
+    assert list(fit.residuals.index) == ["alpha", "Cm", "Cd"]
+    assert fit.residuals.loc["Cd", "rms"] < 0.01
+
+
+def test_evaluate(fit, s1223):
+    cl = np.linspace(0.8, 1.5, 10)
+    res = fit.evaluate(np.array([[1e5], [2e5]]), cl)
+    assert res.Cd.shape == (2, 10)
+    np.testing.assert_allclose(res.Cd[0], s1223.evaluate(1e5, cl).Cd, atol=0.01)
+
+
+def test_json(fit, tmp_path):
+    fit.dump_json(tmp_path / "s1223.json")
+    fit2 = PolarFit.parse_json(tmp_path / "s1223.json")
+    np.testing.assert_array_equal(fit2.lookup([1e5, 2e5], [0.5, 1.0]), fit.lookup([1e5, 2e5], [0.5, 1.0]))
+    np.testing.assert_array_equal(fit2.residuals, fit.residuals)
+
+
+def test_clmax(fit, s1223):
+    np.testing.assert_array_equal(fit.clmax([1e5, 2e5]), s1223.clmax([1e5, 2e5]))
+
+
+def test_stall(fit, s1223):
+    re = [8e4, 1.5e5, 3e5]
+    np.testing.assert_array_equal(fit.clmax(re), s1223.clmax(re))
+    np.testing.assert_array_equal(fit.alpha_stall(re), s1223.alpha_stall(re))
+    np.testing.assert_array_equal(fit.stalled(1.5e5, [0.5, 3]), [False, True])
@@ -0,0 +1,71 @@
+from pytest import fixture, approx
+from pathlib import Path
+import numpy as np
+from acdesign.airfoils.airfoil_set import AirfoilSet
+from acdesign.airfoils.cache import CoordinateCache
+from acdesign.airfoils.index import ShapeIndex
+
+
+@fixture(scope="module")
+def index(naca4):
+    return ShapeIndex.from_set(AirfoilSet.from_airfoils([
+        naca4(m, p, t, 200) for m in [0, 0.02, 0.04] for p in [0.3, 0.4] for t in [0.09, 0.1, 0.12, 0.15]
+        if m > 0 or p == 0.4
+    ]))
+
+
+def test_descriptors(index):
+    row = index.data.loc["naca2412"]
+    assert row.max_thickness == approx(0.12, abs=1e-3)
+    assert row.max_camber == approx(0.02, abs=1e-3)
+    assert row.max_camber_x == approx(0.4, abs=0.02)
+
+
+def test_query(index):
+    res = index.query(max_thickness=(0.095, 0.125), max_camber=(0.035, None))
+    assert sorted(res.index) == ["naca4310", "naca4312", "naca4410", "naca4412"]
+
+
+def test_nearest(index):
+    res = index.nearest("naca2412", k=3)
+    assert "naca2412" not in res.index
+    assert len(res) == 3
+    assert np.all(np.diff(res.distance) >= 0)
+    assert res.index[0] in ["naca2410", "naca2312", "naca2415"]
+
+
+def test_nearest_in_range(index):
+    res = index.nearest("naca2412", k=2, max_camber=(0.035, None))
+    assert res.index[0] == "naca4412"
+    assert np.all(res.max_camber > 0.035)
+
+
+def test_save_load(index, tmp_path):
+    index.save(tmp_path / "shapes.npz")
+    loaded = ShapeIndex.load(tmp_path / "shapes.npz")
+    assert loaded.names == index.names
+    assert list(loaded.nearest("naca0012").index) == list(index.nearest("naca0012").index)
+
+
+def test_from_cache(tmp_path):
+    cache = CoordinateCache(tmp_path / "cache", offline=True)
+    data = Path(__file__).parent.parent / "data"
+    cache.store("goe222", data / "goe222.dat")
+    cache.store("ames63a108", data / "seligdatfile.txt")
+    index, errors = ShapeIndex.from_cache(cache)
+    assert index.names == ["ames63a108", "goe222"]
+    assert errors == {}
+
+
+def test_open_rebuilds_when_cache_changes(tmp_path):
+    cache = CoordinateCache(tmp_path / "cache", offline=True)
+    data = Path(__file__).parent.parent / "data"
+    cache.store("goe222", data / "goe222.dat")
+    path = tmp_path / "shapes.npz"
+    assert ShapeIndex.open(path, cache).names == ["goe222"]
+    written = path.stat().st_mtime_ns
+    assert ShapeIndex.open(path, cache).names == ["goe222"]
+    assert path.stat().st_mtime_ns == written
+    cache.store("ames63a108", data / "seligdatfile.txt")
+    assert ShapeIndex.open(path, cache).names == ["ames63a108", "goe222"]
+    assert list(ShapeIndex.open(path, cache, deg=3).data.columns).count("t3") == 0
@@ -0,0 +1,57 @@
+import copy
+import pickle
+from pytest import fixture
+from acdesign.airfoils.lookup_cache import PolarLookupCache
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+
+def test_hits_and_misses(s1223):
+    cache = PolarLookupCache(s1223)
+    cache.evaluate(1e5, [0.5, 0.6])
+    assert cache.info()["misses"] == 2
+    cache.evaluate(1e5 + 10, [0.50001, 0.6])
+    assert cache.info()["hits"] == 2
+    assert len(cache) == 2
+
+
+def test_matches_polars(s1223):
+    cache = PolarLookupCache(s1223, re_tol=1, cl_tol=1e-6)
+    cl = np.linspace(0.2, 1.5, 20)
+    np.testing.assert_allclose(cache.evaluate(1.5e5, cl).Cd, s1223.evaluate(1.5e5, cl).Cd, atol=1e-6)
+    np.testing.assert_allclose(cache.lookup(1.5e5, cl).Cd, s1223.lookup(1.5e5, cl).Cd, atol=1e-6)
+
+
+def test_eviction(s1223):
+    cache = PolarLookupCache(s1223, maxsize=10)
+    cache.evaluate(1e5, np.linspace(0, 1, 25))
+    assert len(cache) == 10
+    cache.evaluate(1e5, 1.0)
+    assert cache.info()["hits"] == 1
+
+
+def test_threads(s1223):
+    cache = PolarLookupCache(s1223, maxsize=50)
+    with ThreadPoolExecutor(4) as ex:
+        list(ex.map(lambda i: cache.evaluate(1e5 + i * 1000, np.linspace(0, 1, 30)), range(40)))
+    assert cache.hits + cache.misses == 40 * 30
+    assert len(cache) <= 50
+
+
+def test_copy_and_pickle(s1223):
+    cache = PolarLookupCache(s1223)
+    cache.evaluate(1e5, [0.5, 0.6])
+    assert len(copy.copy(cache)) == 2
+    loaded = pickle.loads(pickle.dumps(cache))
+    assert len(loaded) == 2
+    loaded.evaluate(1e5, 0.5)
+    assert loaded.info()["hits"] == 1
+
+
+def test_alpha_and_stall(s1223):
+    cache = PolarLookupCache(s1223, re_tol=1, cl_tol=1e-6)
+    res = cache.aevaluate([1e5, 2e5], [0, 5])
+    np.testing.assert_array_equal(res.alpha, [0, 5])
+    np.testing.assert_allclose(res.Cd, s1223.aevaluate([1e5, 2e5], [0, 5]).Cd, atol=1e-6)
+    assert cache.clmax(1.5e5) == s1223.clmax(1.5e5)
+    np.testing.assert_array_equal(cache.stalled(1.5e5, [0.5, 3]), [False, True])
@@ -0,0 +1,59 @@
+from pytest import fixture, approx
+from pathlib import Path
+import numpy as np
+from acdesign.airfoils.airfoil import Airfoil
+from acdesign.airfoils.panel import PanelSolver, repanel, panel_polars, panel_polars_many
+
+
+@fixture(scope="module")
+def naca0012(naca4):
+    return PanelSolver.from_airfoil(naca4(0, 0, 0.12))
+
+
+@fixture(scope="module")
+def goe222():
+    return Airfoil.parse_selig(Path(__file__).parent.parent / "data/goe222.dat")
+
+
+def test_repanel(goe222):
+    coords = repanel(np.column_stack([goe222.points.x, goe222.points.y]), 41)
+    assert coords.shape == (81, 2)
+    np.testing.assert_allclose(coords[40], [0, 0], atol=1e-12)
+    np.testing.assert_allclose(coords[[0, -1], 0], 1, atol=1e-3)
+
+
+def test_lift_slope(naca0012):
+    sol = naca0012.solve([0, 2, 4])
+    assert sol.Cl[0] == approx(0, abs=1e-6)
+    assert np.diff(sol.Cl) / np.radians(2) == approx(2 * np.pi * (1 + 0.77 * 0.12), rel=0.02)
+    assert sol.Cm == approx(0, abs=0.01)
+    assert sol.gamma.shape == (3, len(naca0012.coords))
+
+
+def test_multiple_rhs(naca0012):
+    together = naca0012.solve([1, 3, 5])
+    for i, a in enumerate([1, 3, 5]):
+        assert naca0012.solve(a).Cl[0] == approx(together.Cl[i])
+
+
+def test_boundary_layer(naca0012):
+    g = naca0012.solve([0]).gamma[0]
+    bl1, bl3 = naca0012.boundary_layer(g, 1e6), naca0012.boundary_layer(g, 3e6)
+    assert 0.004 < bl1.Cd < 0.01
+    assert bl3.Cd < bl1.Cd
+    assert bl1.xtr_top == approx(bl1.xtr_btm)
+    assert bl3.xtr_top < bl1.xtr_top
+
+
+def test_panel_polars(goe222):
+    polars = panel_polars(goe222, [1e5, 3e5])
+    assert set(polars.lift.columns) == {"alpha", "Cl", "Cm", "re", "pre_stall"}
+    assert polars.clmax(2e5) > 1
+    res = polars.lookup(2e5, 0.8)
+    assert res.Cd.iloc[0] > 0
+
+
+def test_panel_polars_many(goe222, naca4):
+    polars, errors = panel_polars_many([naca4(0, 0, 0.12), goe222], [1e5, 3e5], processes=False)
+    assert list(polars.keys()) == ["naca0012", goe222.name]
+    assert errors == {}
@@ -1,6 +1,7 @@
-from pytest import fixture, approx
+from pytest import fixture, approx, raises
 
-from acdesign.airfoils.polar import LFTDRGParser, UIUCPolars, _list_uiucurl, uiuc_airfoils
+from acdesign.airfoils.polar import LFTDRGParser, PolarLookup, UIUCPolars, _list_uiucurl, uiuc_airfoils, interpgrid
+from scipy.interpolate import griddata
 import numpy as np
 import pandas as pd
 
@@ -48,9 +49,20 @@ def test_read_all():
     assert np.all(res.columns == ["alpha", "Cl", "Cm", "re", "pre_stall"])
 
 
-@fixture
-def s1223():
-    return UIUCPolars.from_files('tests/airfoils/S1223.LFT', 'tests/airfoils/S1223.DRG')
+def test_parse_file_matches_read_all():
+    for file in ['tests/airfoils/S1223.LFT', 'tests/airfoils/S1223.DRG', 'tests/airfoils/CLARKYB.DRG']:
+        with open(file, "r") as f:
+            expected = LFTDRGParser(f).read_all()
+        pd.testing.assert_frame_equal(LFTDRGParser.parse_file(file), expected)
+
+
+def test_parse_files():
+    files = ['tests/airfoils/S1223.LFT', 'tests/airfoils/S1223.DRG']
+    res = LFTDRGParser.parse_files(files)
+    assert len(res) == 2
+    assert "Cm" in res[0].columns
+    assert "scd0" in res[1].columns
+
 
 def test_alpha_to_cl(s1223):
     assert s1223.alpha_to_cl([122600, 1.53])[0] == approx(
@@ -64,11 +76,52 @@ def test_alpha_to_cl(s1223):
     assert not np.isnan(s1223.alpha_to_cl([6e9, 1.53]))[0]
 
 
+def test_interpgrid_matches_griddata(s1223):
+    d = s1223.drag
+    tests = np.column_stack([np.linspace(5e4, 5e5, 50), np.linspace(-0.5, 2.5, 50)])
+    expected = griddata(np.column_stack([d.re, d.Cl]), d.Cd.to_numpy(), tests, "linear")
+    nans = np.isnan(expected)
+    expected[nans] = griddata(np.column_stack([d.re, d.Cl]), d.Cd.to_numpy(), tests, "nearest")[nans]
+    np.testing.assert_array_equal(interpgrid(d.re, d.Cl, d.Cd)(tests), expected)
+
+
+def test_interpolators_shared_triangulation(s1223):
+    assert s1223.cl_to_alpha.tri is s1223.cl_to_cm.tri
+
+
 def test_lookup(s1223):
     df = s1223.lookup(re=[100000, 200000], cl=[0.1,0.2,0.8])
     assert isinstance(df, pd.DataFrame)
 
 
+def test_evaluate_broadcasts(s1223):
+    res = s1223.evaluate(np.array([[1e5], [2e5]]), np.array([0.1, 0.2, 0.8]))
+    assert res.Cd.shape == (2, 3)
+    df = s1223.lookup(re=[100000, 200000], cl=[0.1,0.2,0.8])
+    np.testing.assert_array_equal(res.Cd.T.ravel(), df.Cd)
+
+
+def test_aevaluate(s1223):
+    res = s1223.aevaluate(122600, [1.53, 2.57])
+    np.testing.assert_array_equal(res.Cl, s1223.alpha_to_cl([[122600, 1.53], [122600, 2.57]]))
+
+
+def test_alookup(s1223):
+    df = s1223.alookup(re=[100000, 200000], alpha=[0, 2, 4])
+    assert isinstance(df, pd.DataFrame)
+    assert len(df) == 6
+    assert list(df.columns) == ["re", "alpha", "Cl", "Cm", "Cd"]
+    np.testing.assert_array_equal(df.alpha, [0, 0, 2, 2, 4, 4])
+
+
+def test_aevaluate_returns_requested_alpha(s1223):
+    grid = UIUCPolars(s1223.lift, s1223.drag, (20, 40))
+    for polars in [s1223, grid]:
+        res = polars.aevaluate([1e5, 2e5], [0, 5])
+        np.testing.assert_array_equal(res.alpha, [0, 5])
+        np.testing.assert_array_equal(res.Cd, polars.evaluate([1e5, 2e5], res.Cl).Cd)
+
+
 def test_download():
     clarky = UIUCPolars.local("CLARKYB")
     assert isinstance(clarky, UIUCPolars)
@@ -79,3 +132,47 @@ def test_list_uiuc():
 
 def test_uiuc_airfoils():
     assert "CLARKYB" in uiuc_airfoils()
+
+
+@fixture
+def s1223_grid():
+    return UIUCPolars.from_files('tests/airfoils/S1223.LFT', 'tests/airfoils/S1223.DRG', grid=(32, 64))
+
+
+def test_grid_lookup(s1223, s1223_grid):
+    assert s1223_grid.cl_to_cd.shape == (32, 64)
+    df = s1223_grid.lookup(re=[100000, 200000], cl=[1.0, 1.4, 1.8])
+    np.testing.assert_allclose(df.Cd, s1223.lookup(re=[100000, 200000], cl=[1.0, 1.4, 1.8]).Cd, atol=5e-3)
+
+
+def test_grid_bilinear_vectorised(s1223_grid):
+    re = np.full((10, 20), 1.5e5)
+    cl = np.tile(np.linspace(0, 1.5, 20), (10, 1))
+    assert s1223_grid.cl_to_cd.bilinear(re, cl).shape == (10, 20)
+
+
+def test_grid_error(s1223_grid):
+    err = s1223_grid.grid_error()
+    assert list(err.index) == UIUCPolars.interpolators
+    assert np.all(err["max"] >= err["rms"])
+
+
+def test_stall_table(s1223):
+    st = s1223.stall_table
+    assert list(st.columns) == ["re", "Clmax", "alpha_stall"]
+    row = st.iloc[0]
+    assert row.Clmax == s1223.lift.loc[s1223.lift.re==row.re].Cl.max()
+
+
+def test_clmax(s1223):
+    st = s1223.stall_table
+    np.testing.assert_array_equal(s1223.clmax(st.re), st.Clmax)
+    assert s1223.clmax(1.0) == st.Clmax.iloc[0]
+    assert s1223.clmax(np.full((3, 4), 1.5e5)).shape == (3, 4)
+    assert s1223.alpha_stall(st.re.iloc[-1]) == st.alpha_stall.iloc[-1]
+    np.testing.assert_array_equal(s1223.stalled(st.re, st.Clmax + 0.01), True)
+
+
+def test_polar_lookup_is_abstract():
+    with raises(TypeError):
+        PolarLookup()
@@ -0,0 +1,41 @@
+from acdesign.airfoils.registry import PolarRegistry
+from acdesign.airfoils.polar import UIUCPolars
+import os
+import subprocess
+import sys
+
+
+def test_lazy_load():
+    loads = []
+    def loader(name):
+        loads.append(name)
+        return UIUCPolars.local(name)
+
+    reg = PolarRegistry(loader)
+    assert reg.loaded == []
+    p = reg["E472"]
+    assert isinstance(p, UIUCPolars)
+    assert reg["E472"] is p
+    assert loads == ["E472"]
+
+
+def test_local_independent_of_cwd(tmp_path):
+    cwd = os.getcwd()
+    os.chdir(tmp_path)
+    try:
+        assert isinstance(UIUCPolars.local("E472"), UIUCPolars)
+    finally:
+        os.chdir(cwd)
+
+
+def test_performance_import_is_lazy():
+    # a fresh interpreter, as other tests may already have imported or loaded these
+    res = subprocess.run([sys.executable, "-c", (
+        "import sys, acdesign.performance.performance as perf\n"
+        "assert perf.polars.loaded == [], perf.polars.loaded\n"
+        "assert 'bs4' not in sys.modules and 'concurrent.futures' not in sys.modules"
+    )], capture_output=True, text=True)
+    assert res.returncode == 0, res.stderr
+    import acdesign.performance.performance as perf
+    assert isinstance(perf.e472, UIUCPolars)
+    assert "E472" in perf.polars
@@ -0,0 +1,105 @@
+import shutil
+from pytest import fixture, approx, raises
+import numpy as np
+from acdesign.airfoils.polar import UIUCPolars
+from acdesign.airfoils.database import PolarDatabase
+from acdesign.airfoils.screening import PolarTensor, screen
+
+
+@fixture(scope="module")
+def polars():
+    return {name: UIUCPolars.local(name, cache=None) for name in ["SD7037A", "CLARKYB", "E387A", "S1223"]}
+
+
+@fixture(scope="module")
+def tensor(polars):
+    return PolarTensor.from_polars(polars)
+
+
+def test_shape(tensor):
+    assert tensor.names == ["SD7037A", "CLARKYB", "E387A", "S1223"]
+    assert tensor.values.shape == (3, 4, 16, 47)
+    assert tensor.clmax.shape == (4, 16)
+
+
+def test_lookup(tensor, polars):
+    re, cl = np.array([1.5e5, 2e5, 3e5]), np.array([0.7, 0.5, 0.3])
+    alpha, cm, cd, clmax = tensor.lookup(re, cl)
+    assert cd.shape == (4, 3)
+    for i, name in enumerate(tensor.names):
+        res = polars[name].evaluate(re, cl)
+        ok = ~np.isnan(cd[i])
+        np.testing.assert_allclose(cd[i][ok], res.Cd[ok], rtol=0.1)
+        np.testing.assert_allclose(alpha[i][ok], res.alpha[ok], atol=0.2)
+
+
+def test_outside_data(tensor):
+    _, _, cd, _ = tensor.lookup(1e5, 1.75)
+    assert np.isnan(cd[tensor.names.index("CLARKYB")])
+
+
+def test_screen(tensor):
+    table = screen(tensor, [1e5, 2e5, 3e5], [0.9, 0.5, 0.3], [1, 2, 1])
+    assert list(table.columns) == ["Cd", "ClCd", "Cl15Cd", "Cm", "Cm_range", "stall_margin", "coverage"]
+    complete = table.loc[table.coverage == approx(1)]
+    assert np.all(np.diff(complete.Cd) >= 0)
+    assert list(table.index[:len(complete)]) == list(complete.index)
+
+
+def test_screen_rank(tensor):
+    table = screen(tensor, 2e5, 0.6, rank="ClCd")
+    assert np.all(np.diff(table.ClCd.dropna()) <= 0)
+
+
+def test_save_load(tensor, tmp_path):
+    tensor.save(tmp_path / "tensor.npz")
+    loaded = PolarTensor.load(tmp_path / "tensor.npz")
+    assert loaded.names == tensor.names
+    assert loaded.errors == tensor.errors
+    np.testing.assert_array_equal(loaded.values, tensor.values)
+
+
+def test_errors(polars, tmp_path):
+    tensor = PolarTensor.from_polars(dict(polars, broken=None))
+    assert tensor.names == ["SD7037A", "CLARKYB", "E387A", "S1223"]
+    assert list(tensor.errors) == ["broken"]
+    tensor.save(tmp_path / "tensor.npz")
+    assert PolarTensor.load(tmp_path / "tensor.npz").errors == tensor.errors
+    with raises(ValueError):
+        PolarTensor.from_polars(dict(broken=None))
+
+
+def test_open_keyed_on_source(tmp_path):
+    source = tmp_path / "uiuc"
+    source.mkdir()
+    for name in ["S1223.LFT", "S1223.DRG"]:
+        shutil.copy(f"tests/airfoils/{name}", source / name)
+    path = tmp_path / "tensor.npz"
+    tensor = PolarTensor.open(path, source, shape=(4, 5))
+    assert tensor.values.shape == (3, 1, 4, 5)
+    written = path.stat().st_mtime_ns
+    assert PolarTensor.open(path, source, shape=(4, 5)).names == ["S1223"]
+    assert path.stat().st_mtime_ns == written
+    assert PolarTensor.open(path, source, shape=(6, 5)).values.shape == (3, 1, 6, 5)
+    shutil.copy("acdesign/data/uiuc/CLARKYB.LFT", source)
+    shutil.copy("acdesign/data/uiuc/CLARKYB.DRG", source)
+    assert PolarTensor.open(path, source, shape=(6, 5)).names == ["CLARKYB", "S1223"]
+
+
+def test_source_key_defaults():
+    assert PolarTensor.source_key() == PolarTensor.source_key(shape=(16, 47))
+    assert PolarTensor.source_key() != PolarTensor.source_key(re=(5e4, 5e5))
+
+
+def test_grid_database(tmp_path, tensor):
+    for name in ["S1223.LFT", "S1223.DRG", "CLARKYB.LFT", "CLARKYB.DRG"]:
+        shutil.copy(f"acdesign/data/uiuc/{name}", tmp_path / name)
+    db = PolarDatabase.pack(tmp_path, cache=None)
+    grid = PolarTensor.from_polars(PolarDatabase(db.data, db.index, (20, 40)))
+    assert grid.names == ["CLARKYB", "S1223"]
+    scatter = tensor.values[:, [tensor.names.index(n) for n in grid.names]]
+    both = ~np.isnan(grid.values[2]) & ~np.isnan(scatter[2])
+    assert np.mean(np.isnan(grid.values[2]) == np.isnan(scatter[2])) > 0.9
+    np.testing.assert_allclose(grid.values[2][both], scatter[2][both], rtol=0.2)
+    table = screen(grid, [1.5e5, 2e5], [0.8, 1.0])
+    assert table.loc["S1223"].coverage == approx(1)
@@ -0,0 +1,70 @@
+from pytest import fixture, raises
+from pathlib import Path
+import shutil
+import zipfile
+import numpy as np
+from acdesign.airfoils.airfoil import Airfoil, selig_coords
+from acdesign.airfoils.selig import read_coords, read_airfoils, read_set
+
+
+data = Path(__file__).parent.parent / "data"
+
+
+@fixture
+def coord_dir(tmp_path):
+    shutil.copy(data / "seligdatfile.txt", tmp_path / "ames63a108.dat")
+    shutil.copy(data / "goe222.dat", tmp_path / "goe222.dat")
+    (tmp_path / "broken.dat").write_text("BROKEN AIRFOIL\n 1.0 0.0\n 0.5 abc\n")
+    (tmp_path / "odd.dat").write_text("ODD AIRFOIL\n 1.0 0.0\n 0.5\n")
+    return tmp_path
+
+
+@fixture
+def coord_zip(coord_dir, tmp_path):
+    archive = tmp_path / "coord_seligFmt.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        for f in coord_dir.glob("*.dat"):
+            zf.write(f, f"coord_seligFmt/{f.name}")
+    return archive
+
+
+def test_selig_coords_lednicer():
+    name, coords = selig_coords((data / "goe222.dat").read_text())
+    assert name == "GOE 222 (MVA H.33) AIRFOIL"
+    assert coords.shape == (33, 2)
+    assert coords[0, 0] == 1 and coords[-1, 0] == 1
+    assert np.argmin(coords[:, 0]) == 16
+
+
+def test_selig_coords_odd():
+    with raises(ValueError):
+        selig_coords("ODD\n1.0 0.0\n0.5\n")
+
+
+def test_read_coords(coord_dir):
+    coords, errors = read_coords(coord_dir)
+    assert list(coords.keys()) == ["ames63a108", "goe222"]
+    assert set(errors.keys()) == {"broken", "odd"}
+
+
+def test_read_airfoils(coord_dir):
+    airfoils, errors = read_airfoils(coord_dir)
+    for key, file in [("ames63a108", "seligdatfile.txt"), ("goe222", "goe222.dat")]:
+        np.testing.assert_array_equal(
+            airfoils[key].points.data, 
+            Airfoil.parse_selig(data / file).points.data
+        )
+
+
+def test_read_zip(coord_zip, coord_dir):
+    zcoords, zerrors = read_coords(coord_zip)
+    dcoords, derrors = read_coords(coord_dir)
+    assert zcoords.keys() == dcoords.keys()
+    assert zerrors.keys() == derrors.keys()
+
+
+def test_read_set_processes(coord_dir):
+    afs, errors = read_set(coord_dir, m=51, processes=True, max_workers=2)
+    assert afs.names == ["ames63a108", "goe222"]
+    assert afs.upper.shape == (2, 51)
+    assert len(errors) == 2
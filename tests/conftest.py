@@ -0,0 +1,14 @@
+import os
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def user_cache(tmp_path_factory):
+    """keep the acdesign cache for the test session out of the user's home directory"""
+    old = os.environ.get("ACDESIGN_CACHE")
+    os.environ["ACDESIGN_CACHE"] = str(tmp_path_factory.mktemp("acdesign_cache"))
+    yield
+    if old is None:
+        del os.environ["ACDESIGN_CACHE"]
+    else:
+        os.environ["ACDESIGN_CACHE"] = old
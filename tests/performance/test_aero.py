@@ -3,6 +3,7 @@ from acdesign.airfoils.polar import UIUCPolars
 from pytest import fixture, approx
 import numpy as np
 import pandas as pd
+from acdesign.performance.operating_point import OperatingPoint
 from .conftest import op, fd, wing, dmodel
 
 
@@ -43,4 +44,21 @@ def test_quick_trim(op, dmodel):
     df = dmodel.trim(op, 10)
     df2 = dmodel.quick_trim(op, 10)
 
-    pass
\ No newline at end of file
+    pass
+
+def test_wing_clmax(op, wing):
+    clmax = wing.CLmax(op)
+    re = wing.re(op)
+    assert clmax < min(p.clmax(re) for p in wing.polars)
+    assert clmax > 0.5 * min(p.clmax(re) for p in wing.polars)
+
+
+def test_stall_speed(op, dmodel):
+    vs = dmodel.stall_speed(op.atm, 10)
+    assert vs**2 == approx(2 * 9.81 * 10 / (op.atm.rho * dmodel.S * dmodel.clmax_at(OperatingPoint(op.atm, vs))), 1e-3)
+
+
+def test_clmax_property(op, dmodel):
+    assert isinstance(dmodel.CLmax, float)
+    assert dmodel.CLmax == approx(dmodel.wing.clmax(max(p.stall_table.re.max() for p in dmodel.wing.polars)))
+    assert dmodel.clmax_at(op) == dmodel.wing.CLmax(op)